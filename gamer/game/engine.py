@@ -443,11 +443,11 @@ class GameEngine:
                         break
 
         # Check for hidden doors
-        for direction in list(room.secret_doors):
+        for direction in room.get_secret_directions():
             for char in self.party:
                 check = d20(modifier=char.get_skill_modifier("perception"))
                 if check >= 15:  # DC 15 for secret doors
-                    room.secret_doors.remove(direction)
+                    self.dm.dungeon.reveal_secret(direction)
                     found_items.append(f"Discovered a secret passage to the {direction.name.lower()}!")
                     break
 
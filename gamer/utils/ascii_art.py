@@ -655,7 +655,7 @@ def render_dungeon_map(dungeon, radius: int = 3, use_unicode: bool = True) -> st
                 grid[door_y][door_x] = "╞" if use_unicode else "<"
 
             # Mark locked doors
-            if direction in room.locked_doors:
+            if room.is_locked(direction):
                 if direction in [Direction.NORTH, Direction.SOUTH]:
                     grid[door_y][door_x] = "╪" if use_unicode else "X"
                 else:
@@ -1,7 +1,8 @@
 """Dice rolling utilities for D&D 5e."""
 
+import functools
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 def roll_dice(num_dice: int, die_size: int, modifier: int = 0) -> Tuple[int, List[int]]:
@@ -31,6 +32,21 @@ def roll(notation: str) -> Tuple[int, List[int], int]:
     Returns:
         Tuple of (total, individual rolls, modifier)
     """
+    num_dice, die_size, modifier = _parse_notation(notation)
+    if die_size is None:
+        # Just a number, no dice
+        return num_dice + modifier, [], modifier
+
+    total, rolls = roll_dice(num_dice, die_size, modifier)
+    return total, rolls, modifier
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_notation(notation: str) -> Tuple[int, Optional[int], int]:
+    """Parse dice notation into (num_dice, die_size, modifier).
+
+    A plain number comes back as (number, None, modifier).
+    """
     notation = notation.lower().replace(' ', '')
 
     # Parse modifier
@@ -48,13 +64,8 @@ def roll(notation: str) -> Tuple[int, List[int], int]:
     if 'd' in notation:
         num_dice, die_size = notation.split('d')
         num_dice = int(num_dice) if num_dice else 1
-        die_size = int(die_size)
-    else:
-        # Just a number, no dice
-        return int(notation) + modifier, [], modifier
-
-    total, rolls = roll_dice(num_dice, die_size, modifier)
-    return total, rolls, modifier
+        return num_dice, int(die_size), modifier
+    return int(notation), None, modifier
 
 
 def d4(num: int = 1, modifier: int = 0) -> int:
@@ -1,9 +1,14 @@
 """Display utilities for text formatting and output."""
 
+import collections
+import functools
+import io
+import itertools
 import sys
 import os
 import shutil
-from typing import List, Dict, Any, Optional, Tuple
+import signal
+from typing import List, Dict, Any, Optional, Tuple, Deque, Iterable
 
 # ANSI escape codes for terminal colors
 # These work on macOS, Linux, and modern Windows terminals
@@ -71,38 +76,30 @@ def get_terminal_size() -> Tuple[int, int]:
         return (80, 24)
 
 
-def paged_print(text: str, page_size: int = 0) -> None:
-    """
-    Print text with paging support for long content.
-
-    Args:
-        text: Text to print (can be multiline)
-        page_size: Lines per page. If 0, auto-detect from terminal.
-    """
-    lines = text.split('\n')
-
+def _resolve_page_size(page_size: int) -> int:
+    """Return page_size, or a size fitted to the terminal if it is 0."""
     if page_size <= 0:
         _, term_height = get_terminal_size()
         page_size = term_height - 3  # Leave room for prompt
+    return page_size
 
-    if len(lines) <= page_size:
-        # Short enough, just print
-        print(text)
-        return
 
-    # Page through content
+def _paged_print_impl(lines: Iterable[str], total_lines: int, page_size: int) -> None:
+    """Page through lines (without trailing newlines), page_size at a time."""
+    it = iter(lines)
     i = 0
-    while i < len(lines):
+    while True:
         # Print a page
-        page_end = min(i + page_size, len(lines))
-        for line in lines[i:page_end]:
-            print(line)
+        page_lines = list(itertools.islice(it, page_size))
+        if not page_lines:
+            break
+        sys.stdout.write('\n'.join(page_lines) + '\n')
 
-        i = page_end
+        i += len(page_lines)
 
-        if i < len(lines):
+        if i < total_lines:
             # More content - show prompt
-            remaining = len(lines) - i
+            remaining = total_lines - i
             try:
                 prompt = f"{Colors.MUTED}-- More ({remaining} lines) [Enter=continue, q=quit] --{Colors.RESET}"
                 response = input(prompt).strip().lower()
@@ -112,6 +109,49 @@ def paged_print(text: str, page_size: int = 0) -> None:
                 break
 
 
+def paged_print(text: str, page_size: int = 0) -> None:
+    """
+    Print text with paging support for long content.
+
+    Lines are read from the text one page at a time, so quitting early never
+    splits the rest of it.
+
+    Args:
+        text: Text to print (can be multiline)
+        page_size: Lines per page. If 0, auto-detect from terminal.
+    """
+    page_size = _resolve_page_size(page_size)
+
+    # Count the lines iterated below: a trailing newline does not start
+    # another line
+    total_lines = text.count('\n') + (not text.endswith('\n'))
+    if total_lines <= page_size:
+        # Short enough, just print
+        print(text)
+        return
+
+    lines = (line.rstrip('\n') for line in io.StringIO(text))
+    _paged_print_impl(lines, total_lines, page_size)
+
+
+def paged_print_lines(lines: List[str], page_size: int = 0) -> None:
+    """
+    Print already-split lines with paging support.
+
+    Args:
+        lines: Lines to print, without trailing newlines
+        page_size: Lines per page. If 0, auto-detect from terminal.
+    """
+    page_size = _resolve_page_size(page_size)
+
+    if len(lines) <= page_size:
+        # Short enough, just print
+        print('\n'.join(lines))
+        return
+
+    _paged_print_impl(lines, len(lines), page_size)
+
+
 def fits_in_terminal(text: str, margin: int = 5) -> bool:
     """Check if text fits in current terminal without scrolling."""
     _, term_height = get_terminal_size()
@@ -123,48 +163,82 @@ def fits_in_terminal(text: str, margin: int = 5) -> bool:
 # Message Log - Simple message area that shows recent messages
 # -----------------------------------------------------------------------------
 
-_message_log: List[str] = []
 _message_log_max = 3
+_message_log: Deque[str] = collections.deque(maxlen=_message_log_max)
+
+# Message box width, cached by setup_status_panel and refreshed on SIGWINCH
+_message_box_width: Optional[int] = None
+_prev_sigwinch_handler: Any = None
 
 
 def status_message(text: str) -> None:
     """Add a message to the log and display the message box."""
-    global _message_log
     _message_log.append(text)
-    if len(_message_log) > _message_log_max:
-        _message_log = _message_log[-_message_log_max:]
     _draw_message_box()
 
 
+# Colored framing around each message box row
+_MSG_ROW_PREFIX = f"{Colors.MUTED}│{Colors.RESET} {Colors.SUCCESS}"
+_MSG_ROW_SUFFIX = f"{Colors.MUTED}│{Colors.RESET}"
+
+
+@functools.lru_cache(maxsize=8)
+def _message_box_frame(box_width: int) -> Tuple[str, str]:
+    """Return the colored top and bottom lines of the message box."""
+    border = _border('─', box_width)
+    return (f"{Colors.MUTED}┌{border}┐{Colors.RESET}",
+            f"{Colors.MUTED}└{border}┘{Colors.RESET}")
+
+
+@functools.lru_cache(maxsize=128)
+def _fit_message(msg: str, width: int) -> str:
+    """Truncate or pad a message to exactly width characters."""
+    return msg[:width].ljust(width)
+
+
 def _draw_message_box() -> None:
     """Draw the message box with recent messages."""
     if not _message_log:
         return
 
-    cols, _ = get_terminal_size()
-    box_width = min(cols - 4, 70)
+    box_width = _message_box_width
+    if box_width is None:
+        cols, _ = get_terminal_size()
+        box_width = min(cols - 4, 70)
 
     # Draw box
+    top, bottom = _message_box_frame(box_width)
     print()
-    print(f"{Colors.MUTED}┌{'─' * box_width}┐{Colors.RESET}")
+    print(top)
     for msg in _message_log:
-        # Truncate message to fit
-        display_msg = msg[:box_width-2] if len(msg) > box_width-2 else msg
-        padding = ' ' * (box_width - 2 - len(display_msg))
-        print(f"{Colors.MUTED}│{Colors.RESET} {Colors.SUCCESS}{display_msg}{padding}{Colors.MUTED}│{Colors.RESET}")
-    print(f"{Colors.MUTED}└{'─' * box_width}┘{Colors.RESET}")
+        display_msg = _fit_message(msg, box_width - 2)
+        print(f"{_MSG_ROW_PREFIX}{display_msg}{_MSG_ROW_SUFFIX}")
+    print(bottom)
     print()
 
 
 def clear_message_log() -> None:
     """Clear the message log."""
-    global _message_log
-    _message_log = []
+    _message_log.clear()
+
+
+def _on_resize(signum: Optional[int] = None, frame: Any = None) -> None:
+    """Recompute the cached message box width from the terminal size."""
+    global _message_box_width
+    cols, _ = get_terminal_size()
+    _message_box_width = min(cols - 4, 70)
+    _message_box_frame(_message_box_width)
 
 
 def setup_status_panel() -> None:
-    """Set up the status panel (no-op for simple version)."""
-    pass
+    """Set up the status panel, caching its width until the terminal resizes."""
+    global _prev_sigwinch_handler
+    _on_resize()
+    if hasattr(signal, 'SIGWINCH'):
+        try:
+            _prev_sigwinch_handler = signal.signal(signal.SIGWINCH, _on_resize)
+        except ValueError:
+            pass  # Not on the main thread - width stays fixed
 
 
 def clear_status_panel() -> None:
@@ -173,8 +247,12 @@ def clear_status_panel() -> None:
 
 
 def teardown_status_panel() -> None:
-    """Teardown the status panel (no-op for simple version)."""
-    pass
+    """Teardown the status panel, restoring the previous SIGWINCH handler."""
+    global _message_box_width, _prev_sigwinch_handler
+    _message_box_width = None
+    if _prev_sigwinch_handler is not None:
+        signal.signal(signal.SIGWINCH, _prev_sigwinch_handler)
+        _prev_sigwinch_handler = None
 
 
 # D&D Splash Screen ASCII Art
@@ -295,33 +373,51 @@ SPLASH_SIMPLE = r'''
 '''
 
 
+_SPLASH_TEMPLATES: Dict[str, str] = {
+    'dragon': SPLASH_DRAGON,
+    'simple': SPLASH_SIMPLE,
+    'classic': SPLASH_SCREEN,
+}
+
+# Line counts are fixed, so the terminal fit check is a dict lookup
+_SPLASH_LINE_COUNTS: Dict[str, int] = {
+    name: splash.count('\n') for name, splash in _SPLASH_TEMPLATES.items()
+}
+
+# Formatted, UTF-8 encoded splash screens, keyed by the template actually shown
+_splash_bytes_cache: Dict[str, bytes] = {}
+
+
 def show_splash_screen(style: str = "dragon") -> None:
     """Display the D&D splash screen."""
     # Use scrollback-preserving clear
     clear_screen(preserve_scrollback=True)
 
-    if style == "dragon":
-        splash = SPLASH_DRAGON
-    elif style == "simple":
-        splash = SPLASH_SIMPLE
-    else:
-        splash = SPLASH_SCREEN
-
-    # Check if splash fits in terminal
-    _, term_height = get_terminal_size()
-    splash_lines = splash.count('\n')
+    key = style if style in _SPLASH_TEMPLATES else 'classic'
 
     # Use simple splash if terminal is too small
-    if splash_lines > term_height - 2 and style != "simple":
-        splash = SPLASH_SIMPLE
-
-    # Format with colors
-    formatted = splash.format(
-        title=Colors.TITLE,
-        reset=Colors.RESET
-    )
-
-    print(formatted)
+    _, term_height = get_terminal_size()
+    if _SPLASH_LINE_COUNTS[key] > term_height - 2:
+        key = 'simple'
+
+    data = _splash_bytes_cache.get(key)
+    if data is None:
+        # Format with colors
+        formatted = _SPLASH_TEMPLATES[key].format(
+            title=Colors.TITLE,
+            reset=Colors.RESET
+        )
+        data = formatted.encode('utf-8') + b'\n'
+        _splash_bytes_cache[key] = data
+
+    # Flush pending text first so the raw write lands after it
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is not None:
+        buffer.write(data)
+        buffer.flush()
+    else:
+        sys.stdout.write(data.decode('utf-8'))
 
     try:
         input()  # Wait for Enter
@@ -329,12 +425,16 @@ def show_splash_screen(style: str = "dragon") -> None:
         pass  # Handle piped input
 
 
+@functools.lru_cache(maxsize=32)
+def _border(char: str, width: int) -> str:
+    """Return char repeated width times; common widths are reused."""
+    return char * width
+
+
 def print_title(text: str, char: str = '=') -> None:
     """Print a title with decorative borders."""
-    border = char * (len(text) + 4)
-    print(f"\n{Colors.TITLE}{border}")
-    print(f"  {text}  ")
-    print(f"{border}{Colors.RESET}\n")
+    border = _border(char, len(text) + 4)
+    sys.stdout.write(f"\n{Colors.TITLE}{border}\n  {text}  \n{border}{Colors.RESET}\n\n")
 
 
 def print_subtitle(text: str) -> None:
@@ -344,50 +444,46 @@ def print_subtitle(text: str) -> None:
 
 def print_separator(char: str = '-', width: int = 50) -> None:
     """Print a separator line."""
-    print(f"{Colors.MUTED}{char * width}{Colors.RESET}")
+    print(f"{Colors.MUTED}{_border(char, width)}{Colors.RESET}")
 
 
 def print_boxed(text: str, width: int = 50) -> None:
     """Print text in a box."""
-    lines = text.split('\n')
-    print(f"┌{'─' * (width - 2)}┐")
-    for line in lines:
-        padded = line.ljust(width - 4)
-        print(f"│ {padded} │")
-    print(f"└{'─' * (width - 2)}┘")
+    inner = _border('─', width - 2)
+    lines_out = [f"┌{inner}┐"]
+    lines_out.extend(f"│ {line.ljust(width - 4)} │" for line in text.split('\n'))
+    lines_out.append(f"└{inner}┘")
+    sys.stdout.write('\n'.join(lines_out) + '\n')
 
 
 def print_table(headers: List[str], rows: List[List[Any]],
                 col_widths: Optional[List[int]] = None) -> None:
     """Print a formatted table."""
+    # Convert every cell to a string once; reused for widths and output
+    str_headers = [str(h) for h in headers]
+    str_rows = [[str(cell) for cell in row] for row in rows]
+
     if not col_widths:
-        col_widths = []
-        for i, header in enumerate(headers):
-            max_width = len(str(header))
-            for row in rows:
-                if i < len(row):
-                    max_width = max(max_width, len(str(row[i])))
-            col_widths.append(max_width + 2)
+        col_widths = [
+            max(len(header), max((len(r[i]) for r in str_rows if i < len(r)), default=0)) + 2
+            for i, header in enumerate(str_headers)
+        ]
 
     # Header
-    header_str = '│'
-    for i, header in enumerate(headers):
-        header_str += f" {str(header).center(col_widths[i] - 2)} │"
+    header_str = '│' + ''.join(
+        f" {header.center(w - 2)} │" for header, w in zip(str_headers, col_widths))
 
-    border_top = '┌' + '┬'.join('─' * w for w in col_widths) + '┐'
-    border_mid = '├' + '┼'.join('─' * w for w in col_widths) + '┤'
-    border_bot = '└' + '┴'.join('─' * w for w in col_widths) + '┘'
+    segments = [_border('─', w) for w in col_widths]
+    border_top = '┌' + '┬'.join(segments) + '┐'
+    border_mid = '├' + '┼'.join(segments) + '┤'
+    border_bot = '└' + '┴'.join(segments) + '┘'
 
     print(border_top)
     print(f"{Colors.BOLD}{header_str}{Colors.RESET}")
     print(border_mid)
 
-    for row in rows:
-        row_str = '│'
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                row_str += f" {str(cell).ljust(col_widths[i] - 2)} │"
-        print(row_str)
+    for row in str_rows:
+        print('│' + ''.join(f" {cell.ljust(w - 2)} │" for cell, w in zip(row, col_widths)))
 
     print(border_bot)
 
@@ -441,65 +537,136 @@ def format_modifier(mod: int) -> str:
 # Keyboard Input Handling (for arrow keys and hjkl navigation)
 # -----------------------------------------------------------------------------
 
-def _getch(timeout: Optional[float] = None) -> Optional[str]:
+def _enter_raw_mode(fd: int) -> Tuple[List[Any], int]:
     """
-    Read a single character from stdin without waiting for Enter.
-    Works on Unix/macOS. Returns the character or escape sequence.
+    Put the terminal into raw input mode.
 
-    Args:
-        timeout: Optional timeout in seconds. Returns None if timeout occurs.
+    Output processing is left on so that newlines printed while in raw mode
+    (e.g. menu redraws) still return the carriage.
+
+    Returns:
+        The (termios settings, fcntl flags) to pass to _exit_raw_mode.
     """
     import termios
     import tty
-    import select
     import fcntl
 
-    fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
     old_flags = fcntl.fcntl(fd, fcntl.F_GETFL)
 
-    try:
-        tty.setraw(fd)
+    tty.setraw(fd)
+    mode = termios.tcgetattr(fd)
+    mode[1] = old_settings[1]  # oflag
+    termios.tcsetattr(fd, termios.TCSANOW, mode)
+
+    return old_settings, old_flags
+
+
+def _exit_raw_mode(fd: int, old: Tuple[List[Any], int]) -> None:
+    """Restore the terminal state saved by _enter_raw_mode."""
+    import termios
+
+    termios.tcsetattr(fd, termios.TCSADRAIN, old[0])
+
+
+# Input bytes read past the end of the last key, returned by later reads
+_pending_input = bytearray()
+
+
+def _key_length(buf: bytearray) -> int:
+    """Length in bytes of the key at the start of buf (which is non-empty)."""
+    lead = buf[0]
+    if lead == 0x1b:  # ESC
+        if len(buf) == 1:
+            return 1  # Just ESC
+        if buf[1] == 0x5b:  # '['
+            # CSI sequence (most common for arrow keys): runs to the first
+            # final byte, e.g. A=up, B=down, C=right, D=left
+            for i in range(2, len(buf)):
+                if 0x40 <= buf[i] <= 0x7e:
+                    return i + 1
+            return len(buf)
+        if buf[1] == 0x4f:  # 'O'
+            # SS3 sequence (alternative arrow key format)
+            return min(3, len(buf))
+        return 2
+    # Multi-byte UTF-8 character: lead byte plus continuation bytes
+    if lead >= 0xF0:
+        return 4
+    if lead >= 0xE0:
+        return 3
+    if lead >= 0xC0:
+        return 2
+    return 1
+
+
+def _getch_raw(fd: int, old_flags: int,
+               timeout: Optional[float] = None) -> Optional[str]:
+    """
+    Read a single character or escape sequence, assuming raw mode is active.
+
+    Bytes read beyond the returned key (e.g. from a held-down arrow key)
+    are kept and returned by the following calls.
+
+    Args:
+        fd: File descriptor of stdin
+        old_flags: Blocking fcntl flags of fd, as returned by _enter_raw_mode
+        timeout: Optional timeout in seconds. Returns None if timeout occurs.
+    """
+    import select
+    import fcntl
 
+    buf = _pending_input
+    if not buf:
         # Use select to wait with timeout for first character
         if timeout is not None:
-            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            ready, _, _ = select.select([fd], [], [], timeout)
             if not ready:
                 return None  # Timeout
 
-        ch = sys.stdin.read(1)
+        buf += os.read(fd, 1)
+        if not buf:
+            return ''  # End of input
 
-        # Handle escape sequences (arrow keys)
-        if ch == '\x1b':  # ESC
-            # Set non-blocking mode to read rest of sequence
-            fcntl.fcntl(fd, fcntl.F_SETFL, old_flags | os.O_NONBLOCK)
+    # Handle escape sequences (arrow keys)
+    if buf[0] == 0x1b:
+        # Set non-blocking mode and drain whatever else has arrived
+        fcntl.fcntl(fd, fcntl.F_SETFL, old_flags | os.O_NONBLOCK)
+        try:
+            buf += os.read(fd, 32)
+        except (BlockingIOError, InterruptedError):
+            pass  # No more characters available
+        finally:
+            # Restore blocking mode
+            fcntl.fcntl(fd, fcntl.F_SETFL, old_flags)
 
-            try:
-                # Try to read next character
-                ch2 = sys.stdin.read(1)
-                if ch2 == '[':
-                    # CSI sequence (most common for arrow keys)
-                    ch3 = sys.stdin.read(1)
-                    # Arrow keys: A=up, B=down, C=right, D=left
-                    return f'\x1b[{ch3}'
-                elif ch2 == 'O':
-                    # SS3 sequence (alternative arrow key format)
-                    ch3 = sys.stdin.read(1)
-                    return f'\x1bO{ch3}'
-                elif ch2:
-                    return ch + ch2
-                else:
-                    return ch  # Just ESC
-            except (IOError, TypeError):
-                # No more characters available - just ESC
-                return ch
-            finally:
-                # Restore blocking mode
-                fcntl.fcntl(fd, fcntl.F_SETFL, old_flags)
-
-        return ch
+    length = _key_length(buf)
+    if length > len(buf):
+        # Rest of a UTF-8 character still to come
+        buf += os.read(fd, length - len(buf))
+
+    key = bytes(buf[:length])
+    del buf[:length]
+
+    if key[0] == 0x1b:
+        return key.decode('latin-1')
+    return key.decode('utf-8', errors='replace')
+
+
+def _getch(timeout: Optional[float] = None) -> Optional[str]:
+    """
+    Read a single character from stdin without waiting for Enter.
+    Works on Unix/macOS. Returns the character or escape sequence.
+
+    Args:
+        timeout: Optional timeout in seconds. Returns None if timeout occurs.
+    """
+    fd = sys.stdin.fileno()
+    old = _enter_raw_mode(fd)
+    try:
+        return _getch_raw(fd, old[1], timeout)
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        _exit_raw_mode(fd, old)
 
 
 def _is_tty() -> bool:
@@ -507,90 +674,84 @@ def _is_tty() -> bool:
     return sys.stdin.isatty()
 
 
-def _move_cursor_up(lines: int = 1) -> None:
-    """Move cursor up n lines."""
-    print(f'\x1b[{lines}A', end='')
-
-
-def _clear_line() -> None:
-    """Clear the current line."""
-    print('\x1b[2K\r', end='')
+# Escape sequences written straight to stdout, bypassing print()
+_ESC_CLEAR_LINE = '\x1b[2K\r'
+_ESC_HIDE_CURSOR = '\x1b[?25l'
+_ESC_SHOW_CURSOR = '\x1b[?25h'
+_ESC_CLEAR_SCREEN = '\x1b[2J\x1b[H'
 
 
 def _hide_cursor() -> None:
     """Hide the terminal cursor."""
-    print('\x1b[?25l', end='', flush=True)
+    sys.stdout.write(_ESC_HIDE_CURSOR)
+    sys.stdout.flush()
 
 
 def _show_cursor() -> None:
     """Show the terminal cursor."""
-    print('\x1b[?25h', end='', flush=True)
+    sys.stdout.write(_ESC_SHOW_CURSOR)
+    sys.stdout.flush()
 
 
 def print_menu(options: List[str], title: str = "Choose an option:",
                default: Optional[int] = None, show_default: bool = True) -> None:
     """Print a numbered menu with optional default highlighted."""
-    print(f"\n{Colors.SUBTITLE}{title}{Colors.RESET}")
-    for i, option in enumerate(options, 1):
-        if default is not None and i == default and show_default:
-            # Highlight default option
-            print(f"  {Colors.BOLD}{i}.{Colors.RESET} {Colors.TITLE}{option} [default]{Colors.RESET}")
-        else:
-            print(f"  {Colors.BOLD}{i}.{Colors.RESET} {option}")
-    print()
+    bold_c, title_c, reset_c = Colors.BOLD, Colors.TITLE, Colors.RESET
+    highlight = default if show_default else None
 
-
-def _print_interactive_menu(options: List[str], title: str, selected: int,
-                            allow_back: bool = False) -> None:
-    """Print menu with visual selection indicator."""
-    print(f"\n{Colors.SUBTITLE}{title}{Colors.RESET}")
-    back_hint = ", ←/b=back" if allow_back else ""
-    print(f"{Colors.MUTED}  (↑↓/jk: navigate, Enter: select{back_hint}){Colors.RESET}")
-    print()
+    print(f"\n{Colors.SUBTITLE}{title}{reset_c}")
     for i, option in enumerate(options, 1):
-        if i == selected:
-            # Highlighted selection
-            print(f"  {Colors.TITLE}> {i}. {option} <{Colors.RESET}")
+        if i == highlight:
+            # Highlight default option
+            print(f"  {bold_c}{i}.{reset_c} {title_c}{option} [default]{reset_c}")
         else:
-            print(f"    {Colors.MUTED}{i}.{Colors.RESET} {option}")
-    if allow_back:
-        print(f"    {Colors.MUTED}0.{Colors.RESET} ← Back")
+            print(f"  {bold_c}{i}.{reset_c} {option}")
     print()
 
 
-def _redraw_interactive_menu(options: List[str], title: str, selected: int,
-                              total_lines: int, allow_back: bool = False) -> None:
-    """Redraw the menu in place by moving cursor up and reprinting."""
-    # Move cursor up to the start of the menu
-    _move_cursor_up(total_lines)
+def _render_menu(options: List[str], title: str, selected: int,
+                 total_lines: int, allow_back: bool = False,
+                 move_up: bool = False) -> None:
+    """
+    Draw the interactive menu with a visual selection indicator.
 
-    # Reprint the menu
-    _clear_line()
-    print(f"{Colors.SUBTITLE}{title}{Colors.RESET}")
-    _clear_line()
+    The whole menu is built as one string and written at once. With
+    move_up, the cursor first moves back over the previous total_lines
+    lines so the menu is redrawn in place.
+    """
+    title_c, muted_c, reset_c = Colors.TITLE, Colors.MUTED, Colors.RESET
     back_hint = ", ←/b=back" if allow_back else ""
-    print(f"{Colors.MUTED}  (↑↓/jk: navigate, Enter: select{back_hint}){Colors.RESET}")
-    _clear_line()
-    print()
 
+    lines = [
+        f"{Colors.SUBTITLE}{title}{reset_c}",
+        f"{muted_c}  (↑↓/jk: navigate, Enter: select{back_hint}){reset_c}",
+        "",
+    ]
     for i, option in enumerate(options, 1):
-        _clear_line()
         if i == selected:
-            print(f"  {Colors.TITLE}> {i}. {option} <{Colors.RESET}")
+            # Highlighted selection
+            lines.append(f"  {title_c}> {i}. {option} <{reset_c}")
         else:
-            print(f"    {Colors.MUTED}{i}.{Colors.RESET} {option}")
-
+            lines.append(f"    {muted_c}{i}.{reset_c} {option}")
     if allow_back:
-        _clear_line()
-        print(f"    {Colors.MUTED}0.{Colors.RESET} ← Back")
+        lines.append(f"    {muted_c}0.{reset_c} ← Back")
+    lines.append("")
 
-    _clear_line()
-    print()
+    parts = [f'\x1b[{total_lines}A' if move_up else '\n']
+    for line in lines:
+        parts.append(_ESC_CLEAR_LINE)
+        parts.append(line)
+        parts.append('\n')
+
+    sys.stdout.write(''.join(parts))
+    sys.stdout.flush()
 
 
 def get_input(prompt: str = "> ", timeout: Optional[float] = None,
                default: Optional[str] = None) -> str:
     """Get input from user with colored prompt, optional timeout, and optional default."""
+    flush_display()
+
     # Build prompt with default indicator
     if default is not None:
         display_prompt = f"{prompt}[{default}] "
@@ -661,6 +822,20 @@ def get_menu_choice(options: List[str], title: str = "Choose an option:",
         return _get_menu_choice_fallback(options, title, default, use_defaults, timeout, allow_back)
 
 
+# Key -> action for the interactive menu
+_MENU_ACTIONS: Dict[str, str] = {
+    '\x1b[A': 'up', 'k': 'up',                      # Up arrow or k
+    '\x1b[B': 'down', 'j': 'down',                  # Down arrow or j
+    '\x1b[C': 'select', 'l': 'select',              # Right arrow or l - same as Enter
+    '\r': 'select', '\n': 'select', ' ': 'select',   # Enter or Space
+    '\x1b[D': 'back_or_first', 'h': 'back_or_first',  # Left arrow or h - back if allowed
+    '\x1b': 'quit', 'q': 'quit',                     # ESC or q
+    '\x7f': 'back', 'b': 'back',                     # Backspace or 'b' - back if allowed
+    'g': 'first',                                   # g - go to first (vim style)
+    'G': 'last',                                    # G - go to last (vim style)
+}
+
+
 def _get_menu_choice_interactive(options: List[str], title: str, default: int,
                                   allow_back: bool = False) -> int:
     """Interactive menu selection with arrow keys and hjkl."""
@@ -671,52 +846,59 @@ def _get_menu_choice_interactive(options: List[str], title: str, default: int,
     total_lines = 3 + num_options + (1 if allow_back else 0) + 1
 
     # Initial draw
-    _print_interactive_menu(options, title, selected, allow_back)
-    _hide_cursor()
+    _render_menu(options, title, selected, total_lines, allow_back)
+
+    def set_selected(new: int) -> None:
+        """Move the selection, redrawing only if it actually changed."""
+        nonlocal selected
+        if new == selected:
+            return
+        selected = new
+        _render_menu(options, title, selected, total_lines, allow_back, move_up=True)
+
+    fd = sys.stdin.fileno()
+    old = None
 
     try:
+        _hide_cursor()
+        # Enter raw mode once for the whole menu rather than once per keypress
+        old = _enter_raw_mode(fd)
+
         while True:
             try:
-                ch = _getch()
+                ch = _getch_raw(fd, old[1])
+
+                action = _MENU_ACTIONS.get(ch)
 
-                # Arrow keys
-                if ch == '\x1b[A' or ch == 'k':  # Up arrow or k
-                    selected = selected - 1 if selected > 1 else num_options
-                    _redraw_interactive_menu(options, title, selected, total_lines, allow_back)
+                if action == 'up':
+                    set_selected(selected - 1 if selected > 1 else num_options)
 
-                elif ch == '\x1b[B' or ch == 'j':  # Down arrow or j
-                    selected = selected + 1 if selected < num_options else 1
-                    _redraw_interactive_menu(options, title, selected, total_lines, allow_back)
+                elif action == 'down':
+                    set_selected(selected + 1 if selected < num_options else 1)
 
-                elif ch == '\x1b[C' or ch == 'l':  # Right arrow or l - same as Enter
+                elif action == 'select':
                     return selected
 
-                elif ch == '\x1b[D' or ch == 'h':  # Left arrow or h - back if allowed
+                elif action == 'back_or_first':
                     if allow_back:
                         return 0  # Back
                     else:
-                        selected = 1
-                        _redraw_interactive_menu(options, title, selected, total_lines, allow_back)
+                        set_selected(1)
 
-                elif ch == '\r' or ch == '\n' or ch == ' ':  # Enter or Space
-                    return selected
-
-                elif ch == '\x1b' or ch == 'q':  # ESC or q - back if allowed, else default
+                elif action == 'quit':  # Back if allowed, else default
                     if allow_back:
                         return 0
                     return default
 
-                elif ch == '\x7f' or ch == 'b':  # Backspace or 'b' - back if allowed
+                elif action == 'back':
                     if allow_back:
                         return 0
 
-                elif ch == 'g':  # g - go to first (vim style)
-                    selected = 1
-                    _redraw_interactive_menu(options, title, selected, total_lines, allow_back)
+                elif action == 'first':
+                    set_selected(1)
 
-                elif ch == 'G':  # G - go to last (vim style)
-                    selected = num_options
-                    _redraw_interactive_menu(options, title, selected, total_lines, allow_back)
+                elif action == 'last':
+                    set_selected(num_options)
 
                 elif ch.isdigit():  # Number key
                     num = int(ch)
@@ -734,6 +916,8 @@ def _get_menu_choice_interactive(options: List[str], title: str, default: int,
                 return default
 
     finally:
+        if old is not None:
+            _exit_raw_mode(fd, old)
         _show_cursor()
 
 
@@ -782,30 +966,36 @@ def confirm(prompt: str = "Continue?", default: bool = True) -> bool:
     """Get yes/no confirmation. Default is yes."""
     default_str = "y" if default else "n"
     hint = "Y/n" if default else "y/N"
-    response = get_input(f"{prompt} ({hint}): ", default=default_str).lower().strip()
-    return response in ('y', 'yes', '')
+    response = get_input(f"{prompt} ({hint}): ", default=default_str)
+    # Pressing Enter returns the default unchanged - no need to normalise it
+    if response == default_str:
+        return default
+    return response.lower().strip() in ('y', 'yes', '')
 
 
 def print_combat_action(actor: str, action: str, target: str = "",
-                        result: str = "") -> None:
+                        result: str = "", _B: str = Colors.BOLD,
+                        _R: str = Colors.RESET) -> None:
     """Print a formatted combat action."""
-    msg = f"{Colors.BOLD}{actor}{Colors.RESET} {action}"
+    parts = [f"{_B}{actor}{_R} {action}"]
     if target:
-        msg += f" {Colors.BOLD}{target}{Colors.RESET}"
+        parts.append(f" {_B}{target}{_R}")
     if result:
-        msg += f" - {result}"
-    print(msg)
+        parts.append(f" - {result}")
+    parts.append('\n')
+    sys.stdout.write(''.join(parts))
 
 
-def print_damage(amount: int, damage_type: str = "") -> str:
+def print_damage(amount: int, damage_type: str = "", _D: str = Colors.DAMAGE,
+                 _R: str = Colors.RESET) -> str:
     """Format damage for display."""
     type_str = f" {damage_type}" if damage_type else ""
-    return f"{Colors.DAMAGE}{amount}{type_str} damage{Colors.RESET}"
+    return f"{_D}{amount}{type_str} damage{_R}"
 
 
-def print_healing(amount: int) -> str:
+def print_healing(amount: int, _H: str = Colors.HEALING, _R: str = Colors.RESET) -> str:
     """Format healing for display."""
-    return f"{Colors.HEALING}{amount} HP healed{Colors.RESET}"
+    return f"{_H}{amount} HP healed{_R}"
 
 
 def clear_screen(preserve_scrollback: bool = False) -> None:
@@ -819,17 +1009,23 @@ def clear_screen(preserve_scrollback: bool = False) -> None:
     if preserve_scrollback:
         # Scroll the screen content up by printing newlines
         _, term_height = get_terminal_size()
-        print('\n' * term_height, end='')
+        sys.stdout.write('\n' * term_height)
     else:
         # Full clear (destroys scrollback)
-        print('\033[2J\033[H', end='')
+        sys.stdout.write(_ESC_CLEAR_SCREEN)
 
 
-def print_dm(text: str) -> None:
+def print_dm(text: str, _M: str = Colors.MUTED, _R: str = Colors.RESET) -> None:
     """Print DM narration text."""
-    print(f"\n{Colors.MUTED}*{Colors.RESET} {text}")
+    sys.stdout.write(f"\n{_M}*{_R} {text}\n")
 
 
-def print_dialogue(speaker: str, text: str) -> None:
+def print_dialogue(speaker: str, text: str, _N: str = Colors.NPC,
+                   _R: str = Colors.RESET) -> None:
     """Print NPC dialogue."""
-    print(f"\n{Colors.NPC}{speaker}:{Colors.RESET} \"{text}\"")
+    sys.stdout.write(f"\n{_N}{speaker}:{_R} \"{text}\"\n")
+
+
+def flush_display() -> None:
+    """Flush buffered display output. get_input calls this before reading."""
+    sys.stdout.flush()
@@ -1,8 +1,9 @@
 """Procedural dungeon generation."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional, Tuple, Set
 from enum import Enum, auto
+from itertools import accumulate
 import random
 
 from .encounters import Encounter
@@ -33,16 +34,37 @@ class Direction(Enum):
 
     @property
     def opposite(self) -> 'Direction':
-        opposites = {
-            Direction.NORTH: Direction.SOUTH,
-            Direction.SOUTH: Direction.NORTH,
-            Direction.EAST: Direction.WEST,
-            Direction.WEST: Direction.EAST,
-        }
-        return opposites[self]
+        return _OPPOSITE[self]
+
+
+_DIRECTIONS: Tuple[Direction, ...] = tuple(Direction)
+
+# (direction, dx, dy) for each direction, so samplers skip Enum.value lookups
+_DIRECTION_STEPS: Tuple[Tuple[Direction, int, int], ...] = tuple(
+    (d, d.value[0], d.value[1]) for d in _DIRECTIONS
+)
+
+_OPPOSITE: Dict[Direction, Direction] = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.EAST: Direction.WEST,
+    Direction.WEST: Direction.EAST,
+}
+
+_DIR_NAME: Dict[Direction, str] = {d: d.name for d in Direction}
+_DIR_NAME_LOWER: Dict[Direction, str] = {d: d.name.lower() for d in Direction}
+_ROOMTYPE_NAME: Dict[RoomType, str] = {rt: rt.name for rt in RoomType}
+
+# One bit per direction for Room.locked_mask / Room.secret_mask
+_DIR_BIT: Dict[Direction, int] = {
+    Direction.NORTH: 1,
+    Direction.SOUTH: 2,
+    Direction.EAST: 4,
+    Direction.WEST: 8,
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomFeature:
     """A feature or object in a room."""
     name: str
@@ -52,7 +74,7 @@ class RoomFeature:
     hidden_dc: int = 0  # DC to find if hidden, 0 if visible
 
 
-@dataclass
+@dataclass(slots=True)
 class Trap:
     """A trap in a dungeon."""
     name: str
@@ -67,7 +89,7 @@ class Trap:
     disarmed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     """A room in the dungeon."""
     id: int
@@ -79,8 +101,8 @@ class Room:
 
     # Connections
     exits: Dict[Direction, int] = field(default_factory=dict)  # direction -> room_id
-    locked_doors: Set[Direction] = field(default_factory=set)
-    secret_doors: Set[Direction] = field(default_factory=set)
+    locked_mask: int = 0  # _DIR_BIT flags of locked doors
+    secret_mask: int = 0  # _DIR_BIT flags of undiscovered secret doors
 
     # Contents
     features: List[RoomFeature] = field(default_factory=list)
@@ -93,21 +115,51 @@ class Room:
     cleared: bool = False
     lit: bool = True
 
+    # Last exits description, keyed by the door state it was built from
+    _exits_desc_cache: Optional[Tuple[Tuple[Tuple[Direction, ...], int, int], str]] = field(
+        default=None, init=False, repr=False, compare=False)
+
     def get_exits_description(self) -> str:
         """Get a description of available exits."""
         if not self.exits:
             return "There are no exits."
 
-        exit_strs = []
-        for direction in self.exits:
-            door_type = "door"
-            if direction in self.locked_doors:
-                door_type = "locked door"
-            elif direction in self.secret_doors:
-                door_type = "passage"
-            exit_strs.append(f"{direction.name.lower()} ({door_type})")
-
-        return f"Exits: {', '.join(exit_strs)}."
+        # The exit directions plus the door masks identify the state;
+        # changing an exit, unlocking or revealing a door changes the key
+        key = (tuple(self.exits), self.locked_mask, self.secret_mask)
+        cached = self._exits_desc_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        exit_strs = ', '.join(
+            f"{_DIR_NAME_LOWER[direction]} ({self._door_type(direction)})"
+            for direction in self.exits
+        )
+
+        desc = f"Exits: {exit_strs}."
+        self._exits_desc_cache = (key, desc)
+        return desc
+
+    def _door_type(self, direction: Direction) -> str:
+        """Describe the door leading in a direction."""
+        bit = _DIR_BIT[direction]
+        if self.locked_mask & bit:
+            return "locked door"
+        if self.secret_mask & bit:
+            return "passage"
+        return "door"
+
+    def is_locked(self, direction: Direction) -> bool:
+        """Check whether the door in a direction is locked."""
+        return bool(self.locked_mask & _DIR_BIT[direction])
+
+    def is_secret(self, direction: Direction) -> bool:
+        """Check whether the door in a direction is an undiscovered secret."""
+        return bool(self.secret_mask & _DIR_BIT[direction])
+
+    def get_secret_directions(self) -> List[Direction]:
+        """Get the directions of undiscovered secret doors."""
+        return [d for d in _DIRECTIONS if self.secret_mask & _DIR_BIT[d]]
 
     def get_full_description(self) -> str:
         """Get full room description including features."""
@@ -126,12 +178,12 @@ class Room:
         """Convert to dictionary."""
         return {
             'id': self.id,
-            'room_type': self.room_type.name,
+            'room_type': _ROOMTYPE_NAME[self.room_type],
             'name': self.name,
             'description': self.description,
             'x': self.x,
             'y': self.y,
-            'exits': {d.name: rid for d, rid in self.exits.items()},
+            'exits': {_DIR_NAME[d]: rid for d, rid in self.exits.items()},
             'visited': self.visited,
             'cleared': self.cleared,
         }
@@ -241,6 +293,14 @@ FEATURES: Dict[RoomType, List[Tuple[str, str]]] = {
     ],
 }
 
+# Tuple views of the tables above, indexed directly by _create_room. Every
+# room type has names and descriptions; FEATURES is sparse.
+_ROOM_NAMES_T: Dict[RoomType, Tuple[str, ...]] = {rt: tuple(v) for rt, v in ROOM_NAMES.items()}
+_ROOM_DESCRIPTIONS_T: Dict[RoomType, Tuple[str, ...]] = {
+    rt: tuple(v) for rt, v in ROOM_DESCRIPTIONS.items()
+}
+_FEATURES_T: Dict[RoomType, Tuple[Tuple[str, str], ...]] = {rt: tuple(v) for rt, v in FEATURES.items()}
+
 # Trap templates
 TRAP_TEMPLATES = [
     Trap("Pit Trap", "A concealed pit with spikes below.", 12, 15, "2d10", "piercing", 12, "dex"),
@@ -251,7 +311,7 @@ TRAP_TEMPLATES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Dungeon:
     """A procedurally generated dungeon."""
     name: str
@@ -259,6 +319,20 @@ class Dungeon:
     rooms: Dict[int, Room] = field(default_factory=dict)
     current_room_id: int = 0
 
+    # Lookup indexes maintained by add_room and move
+    _pos_index: Dict[Tuple[int, int], int] = field(default_factory=dict, init=False, repr=False)
+    _visited_positions: Set[Tuple[int, int]] = field(default_factory=set, init=False, repr=False)
+
+    def __post_init__(self):
+        # Index rooms passed to the constructor
+        for room in self.rooms.values():
+            self._pos_index[(room.x, room.y)] = room.id
+            if room.visited:
+                self._visited_positions.add((room.x, room.y))
+        current = self.current_room
+        if current:
+            self._visited_positions.add((current.x, current.y))
+
     @property
     def current_room(self) -> Optional[Room]:
         """Get the current room."""
@@ -268,6 +342,13 @@ class Dungeon:
         """Get a room by ID."""
         return self.rooms.get(room_id)
 
+    def add_room(self, room: Room) -> None:
+        """Add a room, indexing it by position."""
+        self.rooms[room.id] = room
+        self._pos_index[(room.x, room.y)] = room.id
+        if room.visited:
+            self._visited_positions.add((room.x, room.y))
+
     def move(self, direction: Direction) -> Tuple[bool, str]:
         """
         Attempt to move in a direction.
@@ -278,14 +359,14 @@ class Dungeon:
             return False, "You are nowhere."
 
         if direction not in current.exits:
-            return False, f"There is no exit to the {direction.name.lower()}."
+            return False, f"There is no exit to the {_DIR_NAME_LOWER[direction]}."
 
-        if direction in current.locked_doors:
-            return False, f"The door to the {direction.name.lower()} is locked."
+        if current.is_locked(direction):
+            return False, f"The door to the {_DIR_NAME_LOWER[direction]} is locked."
 
-        if direction in current.secret_doors:
+        if current.is_secret(direction):
             # Secret doors need to be discovered first
-            return False, f"There is no obvious exit to the {direction.name.lower()}."
+            return False, f"There is no obvious exit to the {_DIR_NAME_LOWER[direction]}."
 
         # Move to new room
         new_room_id = current.exits[direction]
@@ -293,22 +374,23 @@ class Dungeon:
 
         new_room = self.rooms[new_room_id]
         new_room.visited = True
+        self._visited_positions.add((new_room.x, new_room.y))
 
-        return True, f"You travel {direction.name.lower()} to the {new_room.name}."
+        return True, f"You travel {_DIR_NAME_LOWER[direction]} to the {new_room.name}."
 
     def unlock_door(self, direction: Direction) -> bool:
         """Unlock a door in the current room."""
         current = self.current_room
-        if current and direction in current.locked_doors:
-            current.locked_doors.remove(direction)
+        if current and current.is_locked(direction):
+            current.locked_mask &= ~_DIR_BIT[direction]
             return True
         return False
 
     def reveal_secret(self, direction: Direction) -> bool:
         """Reveal a secret door in the current room."""
         current = self.current_room
-        if current and direction in current.secret_doors:
-            current.secret_doors.remove(direction)
+        if current and current.is_secret(direction):
+            current.secret_mask &= ~_DIR_BIT[direction]
             return True
         return False
 
@@ -331,12 +413,11 @@ class Dungeon:
         min_x = max_x = current.x
         min_y = max_y = current.y
 
-        for room in self.rooms.values():
-            if room.visited:
-                min_x = min(min_x, room.x)
-                max_x = max(max_x, room.x)
-                min_y = min(min_y, room.y)
-                max_y = max(max_y, room.y)
+        for x, y in self._visited_positions:
+            min_x = min(min_x, x)
+            max_x = max(max_x, x)
+            min_y = min(min_y, y)
+            max_y = max(max_y, y)
 
         # Limit to radius around current position
         min_x = max(min_x, current.x - radius)
@@ -347,132 +428,162 @@ class Dungeon:
         # Build map grid
         lines = []
         for y in range(min_y, max_y + 1):
-            row = ""
+            row_parts = []
             for x in range(min_x, max_x + 1):
                 # Find room at this position
                 room_here = None
-                for room in self.rooms.values():
-                    if room.x == x and room.y == y and room.visited:
-                        room_here = room
-                        break
+                rid = self._pos_index.get((x, y))
+                if rid is not None and self.rooms[rid].visited:
+                    room_here = self.rooms[rid]
 
                 if room_here:
                     if room_here.id == self.current_room_id:
-                        row += "[*]"
+                        row_parts.append("[*]")
                     elif room_here.room_type == RoomType.ENTRANCE:
-                        row += "[E]"
+                        row_parts.append("[E]")
                     elif room_here.room_type == RoomType.BOSS:
-                        row += "[B]"
+                        row_parts.append("[B]")
                     else:
-                        row += "[ ]"
+                        row_parts.append("[ ]")
                 else:
-                    row += "   "
+                    row_parts.append("   ")
 
-            lines.append(row)
+            lines.append("".join(row_parts))
 
         return "\n".join(lines)
 
 
-def generate_dungeon(name: str, level: int = 1, num_rooms: int = 10) -> Dungeon:
-    """Generate a procedural dungeon."""
-    dungeon = Dungeon(name=name, level=level)
+def _sample_topology(num_rooms: int) -> Tuple[List[Tuple[int, int]],
+                                                List[Optional[Tuple[int, Direction]]],
+                                                bool]:
+    """
+    Sample a dungeon layout as plain data, without building any rooms.
 
-    # Room type distribution based on dungeon level
-    room_weights = {
-        RoomType.CORRIDOR: 20,
-        RoomType.CHAMBER: 25,
-        RoomType.EMPTY: 15,
-        RoomType.TRAP: 5 + level * 2,
-        RoomType.TREASURE: 5,
-        RoomType.REST: 5,
-        RoomType.SHRINE: 3,
-        RoomType.LIBRARY: 3,
-        RoomType.ARMORY: 3,
-        RoomType.PRISON: 3,
-    }
-
-    # Create entrance
-    entrance = _create_room(0, RoomType.ENTRANCE, 0, 0)
-    dungeon.rooms[0] = entrance
-    entrance.visited = True
+    Returns:
+        (positions, links, has_boss): positions[i] is the (x, y) of room i,
+        links[i] is (parent room id, direction from the parent) for every
+        room except the entrance (links[0] is None), and has_boss is True if
+        the last room was placed as the boss room.
+    """
+    positions: List[Tuple[int, int]] = [(0, 0)]
+    links: List[Optional[Tuple[int, Direction]]] = [None]
 
-    # Track positions
-    positions: Dict[Tuple[int, int], int] = {(0, 0): 0}
+    # Track positions; frontier entries carry their room id so expanding
+    # one never needs a position -> id lookup
+    occupied: Set[Tuple[int, int]] = {(0, 0)}
+    frontier: List[Tuple[int, int, int]] = [(0, 0, 0)]  # (x, y, room_id) that can expand
 
-    # Generate remaining rooms
-    room_id = 1
-    frontier = [(0, 0)]  # Positions that can expand
+    randrange = random.randrange
+    sample = random.sample
 
-    while room_id < num_rooms - 1 and frontier:  # -1 to save room for boss
+    while len(positions) < num_rooms - 1 and frontier:  # -1 to save room for boss
         # Pick a position to expand from
-        pos = random.choice(frontier)
-        current_room = dungeon.rooms[positions[pos]]
+        pos_idx = randrange(len(frontier))
+        x, y, parent_id = frontier[pos_idx]
 
         # Try to add a room in a random direction
-        directions = list(Direction)
-        random.shuffle(directions)
-
         expanded = False
-        for direction in directions:
-            dx, dy = direction.value
-            new_pos = (pos[0] + dx, pos[1] + dy)
+        for direction, dx, dy in sample(_DIRECTION_STEPS, 4):
+            new_pos = (x + dx, y + dy)
 
-            if new_pos in positions:
+            if new_pos in occupied:
                 continue
 
-            # Select room type
-            room_type = _weighted_choice(room_weights)
-
-            # Create room
-            new_room = _create_room(room_id, room_type, new_pos[0], new_pos[1])
-
-            # Connect rooms
-            current_room.exits[direction] = room_id
-            new_room.exits[direction.opposite] = positions[pos]
-
-            # Chance for locked door
-            if random.random() < 0.15:
-                current_room.locked_doors.add(direction)
-                new_room.locked_doors.add(direction.opposite)
-
-            # Add to dungeon
-            dungeon.rooms[room_id] = new_room
-            positions[new_pos] = room_id
-            frontier.append(new_pos)
+            frontier.append((new_pos[0], new_pos[1], len(positions)))
+            occupied.add(new_pos)
+            links.append((parent_id, direction))
+            positions.append(new_pos)
 
-            room_id += 1
             expanded = True
             break
 
         if not expanded:
-            frontier.remove(pos)
+            # Swap with the last entry and pop - order does not matter
+            frontier[pos_idx] = frontier[-1]
+            frontier.pop()
 
     # Add boss room at the end
     if frontier:
         # Find furthest room from entrance
-        furthest_pos = max(frontier, key=lambda p: abs(p[0]) + abs(p[1]))
-        furthest_room = dungeon.rooms[positions[furthest_pos]]
+        fx, fy, furthest_id = max(frontier, key=lambda p: abs(p[0]) + abs(p[1]))
 
         # Find an open direction
-        for direction in Direction:
-            if direction not in furthest_room.exits:
-                dx, dy = direction.value
-                boss_pos = (furthest_pos[0] + dx, furthest_pos[1] + dy)
-
-                if boss_pos not in positions:
-                    boss_room = _create_room(room_id, RoomType.BOSS, boss_pos[0], boss_pos[1])
-                    furthest_room.exits[direction] = room_id
-                    boss_room.exits[direction.opposite] = positions[furthest_pos]
-                    dungeon.rooms[room_id] = boss_room
-                    break
+        for direction, dx, dy in _DIRECTION_STEPS:
+            boss_pos = (fx + dx, fy + dy)
+
+            if boss_pos not in occupied:
+                links.append((furthest_id, direction))
+                positions.append(boss_pos)
+                return positions, links, True
+
+    return positions, links, False
+
+
+def generate_dungeon(name: str, level: int = 1, num_rooms: int = 10) -> Dungeon:
+    """Generate a procedural dungeon."""
+    dungeon = Dungeon(name=name, level=level)
+
+    # Room type distribution based on dungeon level
+    room_weights = {
+        RoomType.CORRIDOR: 20,
+        RoomType.CHAMBER: 25,
+        RoomType.EMPTY: 15,
+        RoomType.TRAP: 5 + level * 2,
+        RoomType.TREASURE: 5,
+        RoomType.REST: 5,
+        RoomType.SHRINE: 3,
+        RoomType.LIBRARY: 3,
+        RoomType.ARMORY: 3,
+        RoomType.PRISON: 3,
+    }
+    # Cumulative table, built once per dungeon for random.choices
+    room_types = list(room_weights)
+    cum_weights = list(accumulate(room_weights.values()))
+
+    # Lay out the whole dungeon first, then build every room in one pass
+    positions, links, has_boss = _sample_topology(num_rooms)
+    boss_id = len(positions) - 1 if has_boss else -1
+
+    # Draw room types and locked-door rolls for every room up front
+    type_picks = random.choices(room_types, cum_weights=cum_weights, k=len(positions))
+    lock_picks = [random.random() < 0.15 for _ in range(len(positions))]
+
+    for room_id, (x, y) in enumerate(positions):
+        if room_id == 0:
+            room_type = RoomType.ENTRANCE
+        elif room_id == boss_id:
+            room_type = RoomType.BOSS
+        else:
+            room_type = type_picks[room_id]
+
+        room = _create_room(room_id, room_type, x, y)
+
+        if room_id == 0:
+            room.visited = True
+        else:
+            # Connect rooms
+            parent_id, direction = links[room_id]
+            parent = dungeon.rooms[parent_id]
+            parent.exits[direction] = room_id
+            room.exits[direction.opposite] = parent_id
+
+            # Chance for locked door (never on the way into the boss room)
+            if room_id != boss_id and lock_picks[room_id]:
+                parent.locked_mask |= _DIR_BIT[direction]
+                room.locked_mask |= _DIR_BIT[direction.opposite]
+
+        dungeon.add_room(room)
 
     return dungeon
 
 
 def _create_room(room_id: int, room_type: RoomType, x: int, y: int) -> Room:
     """Create a room with appropriate description and features."""
-    name = random.choice(ROOM_NAMES.get(room_type, ["Room"]))
-    description = random.choice(ROOM_DESCRIPTIONS.get(room_type, ["An empty room."]))
+    rand = random.randrange
+    names = _ROOM_NAMES_T[room_type]
+    name = names[rand(len(names))]
+    descriptions = _ROOM_DESCRIPTIONS_T[room_type]
+    description = descriptions[rand(len(descriptions))]
 
     room = Room(
         id=room_id,
@@ -484,27 +595,18 @@ def _create_room(room_id: int, room_type: RoomType, x: int, y: int) -> Room:
     )
 
     # Add features
-    if room_type in FEATURES:
+    available_features = _FEATURES_T.get(room_type)
+    if available_features:
         num_features = random.randint(0, 2)
-        available_features = FEATURES[room_type]
-        for _ in range(min(num_features, len(available_features))):
-            fname, fdesc = random.choice(available_features)
+        num_available = len(available_features)
+        for _ in range(min(num_features, num_available)):
+            fname, fdesc = available_features[rand(num_available)]
             room.features.append(RoomFeature(fname, fdesc))
 
     # Add trap if trap room
     if room_type == RoomType.TRAP:
-        room.trap = random.choice(TRAP_TEMPLATES)
+        # Copy the template so triggering/disarming one trap leaves others alone
+        room.trap = replace(TRAP_TEMPLATES[rand(len(TRAP_TEMPLATES))])
 
     return room
 
-
-def _weighted_choice(weights: Dict[RoomType, int]) -> RoomType:
-    """Select a room type based on weights."""
-    total = sum(weights.values())
-    r = random.randint(1, total)
-    cumulative = 0
-    for room_type, weight in weights.items():
-        cumulative += weight
-        if r <= cumulative:
-            return room_type
-    return RoomType.EMPTY
@@ -1,11 +1,15 @@
 """Encounter generation and balancing for D&D 5e."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from enum import Enum
+import bisect
+import functools
+import itertools
+import math
 import random
 
-from .monsters import Monster, get_monster, get_monsters_by_cr_range, MONSTERS
+from .monsters import Monster, get_monster, get_monsters_by_cr_range, registry_version, MONSTERS
 
 
 class Difficulty(Enum):
@@ -25,6 +29,22 @@ XP_THRESHOLDS: Dict[int, Dict[Difficulty, int]] = {
     5: {Difficulty.EASY: 250, Difficulty.MEDIUM: 500, Difficulty.HARD: 750, Difficulty.DEADLY: 1100},
 }
 
+# Same thresholds as a level-by-difficulty grid, for index lookups
+_DIFFICULTY_INDEX: Dict[Difficulty, int] = {d: i for i, d in enumerate(Difficulty)}
+_XP_TABLE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(XP_THRESHOLDS[level][d] for d in Difficulty)
+    for level in range(1, 6)
+)
+
+# Highest monster CR, as a fraction of average party level, per difficulty
+_CR_FACTOR: Dict[Difficulty, float] = {
+    Difficulty.EASY: 0.25,
+    Difficulty.MEDIUM: 0.5,
+    Difficulty.HARD: 0.75,
+    Difficulty.DEADLY: 1.0,
+}
+_BOSS_CR_FACTOR = 0.75
+
 # XP by CR
 CR_XP: Dict[float, int] = {
     0: 10,
@@ -48,33 +68,84 @@ ENCOUNTER_MULTIPLIERS: Dict[Tuple[int, int], float] = {
     (15, 999): 4.0,
 }
 
+# Multiplier indexed directly by monster count; counts past the end use 4.0
+_MULT_TABLE: Tuple[float, ...] = tuple(
+    next((mult for (lo, hi), mult in ENCOUNTER_MULTIPLIERS.items() if lo <= n <= hi), 4.0)
+    for n in range(16)
+)
+# The same multipliers in tenths, so adjusted XP stays in integer arithmetic
+_MULT_X10: Tuple[int, ...] = tuple(round(mult * 10) for mult in _MULT_TABLE)
+
 
+@functools.lru_cache(maxsize=None)
 def get_xp_threshold(level: int, difficulty: Difficulty) -> int:
     """Get XP threshold for a character level and difficulty."""
     if level > 5:
         level = 5  # Cap at level 5 for now
-    return XP_THRESHOLDS.get(level, XP_THRESHOLDS[1]).get(difficulty, 0)
+    elif level < 1:
+        level = 1
+    return _XP_TABLE[level - 1][_DIFFICULTY_INDEX[difficulty]]
+
+
+# Per-difficulty thresholds indexed directly by character level 0-20,
+# with the clamping of get_xp_threshold already applied
+_MAX_LEVEL = 20
+_PARTY_ROW: Dict[Difficulty, Tuple[int, ...]] = {
+    d: tuple(get_xp_threshold(level, d) for level in range(_MAX_LEVEL + 1))
+    for d in Difficulty
+}
 
 
 def get_party_threshold(party_levels: List[int], difficulty: Difficulty) -> int:
     """Get total XP threshold for a party."""
-    return sum(get_xp_threshold(level, difficulty) for level in party_levels)
+    row = _PARTY_ROW[difficulty]
+    return sum(
+        row[level] if 0 <= level <= _MAX_LEVEL else get_xp_threshold(level, difficulty)
+        for level in party_levels
+    )
 
 
+@functools.lru_cache(maxsize=None)
 def get_cr_xp(cr: float) -> int:
     """Get XP value for a CR."""
-    return CR_XP.get(cr, int(cr * 200))
+    xp = CR_XP.get(cr)
+    return xp if xp is not None else int(cr * 200)
 
 
 def get_encounter_multiplier(num_monsters: int) -> float:
     """Get the encounter multiplier for a number of monsters."""
-    for (min_count, max_count), multiplier in ENCOUNTER_MULTIPLIERS.items():
-        if min_count <= num_monsters <= max_count:
-            return multiplier
+    if 0 <= num_monsters < len(_MULT_TABLE):
+        return _MULT_TABLE[num_monsters]
     return 4.0
 
 
-@dataclass
+def _adjusted_xp(total_xp: int, num_monsters: int) -> int:
+    """Apply the encounter multiplier, truncating like int(total * multiplier)."""
+    if 0 <= num_monsters < len(_MULT_X10):
+        return total_xp * _MULT_X10[num_monsters] // 10
+    return total_xp * 4
+
+
+@functools.lru_cache(maxsize=256)
+def _cr_range_eighths(min_eighths: int, max_eighths: int, version: int) -> Tuple[Monster, ...]:
+    """Monster templates whose CR, in eighths, falls in the given range."""
+    return tuple(get_monsters_by_cr_range(min_eighths / 8, max_eighths / 8))
+
+
+def _monsters_in_cr_range(min_cr: float, max_cr: float) -> Tuple[Monster, ...]:
+    """Cached get_monsters_by_cr_range for the encounter generators."""
+    # CRs are multiples of 1/8, so snapping the bounds inward selects the same
+    # monsters; keying on the registry version picks up added or replaced ones
+    return _cr_range_eighths(math.ceil(min_cr * 8), math.floor(max_cr * 8), registry_version())
+
+
+@functools.lru_cache(maxsize=1)
+def _strongest_monster(version: int) -> Monster:
+    """Highest-CR monster template, recomputed only when the registry changes."""
+    return max(MONSTERS.values(), key=lambda m: m.cr)
+
+
+@dataclass(slots=True)
 class Encounter:
     """A combat encounter."""
     monsters: List[Monster] = field(default_factory=list)
@@ -83,16 +154,23 @@ class Encounter:
     adjusted_xp: int = 0
     description: str = ""
 
+    def __post_init__(self):
+        self._recalculate_xp()
+
     def add_monster(self, monster: Monster) -> None:
         """Add a monster to the encounter."""
         self.monsters.append(monster)
         self._recalculate_xp()
 
+    def add_monsters(self, monsters: Iterable[Monster]) -> None:
+        """Add several monsters, recalculating XP once."""
+        self.monsters.extend(monsters)
+        self._recalculate_xp()
+
     def _recalculate_xp(self) -> None:
         """Recalculate total and adjusted XP."""
         self.total_xp = sum(get_cr_xp(m.cr) for m in self.monsters)
-        multiplier = get_encounter_multiplier(len(self.monsters))
-        self.adjusted_xp = int(self.total_xp * multiplier)
+        self.adjusted_xp = _adjusted_xp(self.total_xp, len(self.monsters))
 
     def get_xp_reward(self) -> int:
         """Get XP reward for defeating this encounter."""
@@ -109,6 +187,16 @@ class Encounter:
         }
 
 
+@functools.lru_cache(maxsize=256)
+def _party_thresholds(party_key: Tuple[int, ...]) -> Tuple[int, int, int]:
+    """Deadly, hard and medium XP thresholds for a sorted tuple of levels."""
+    return (
+        get_party_threshold(party_key, Difficulty.DEADLY),
+        get_party_threshold(party_key, Difficulty.HARD),
+        get_party_threshold(party_key, Difficulty.MEDIUM),
+    )
+
+
 def calculate_difficulty(party_levels: List[int], monsters: List[Monster]) -> Difficulty:
     """Calculate encounter difficulty for a party against monsters."""
     if not monsters:
@@ -116,20 +204,15 @@ def calculate_difficulty(party_levels: List[int], monsters: List[Monster]) -> Di
 
     # Calculate adjusted XP
     total_xp = sum(get_cr_xp(m.cr) for m in monsters)
-    multiplier = get_encounter_multiplier(len(monsters))
-    adjusted_xp = int(total_xp * multiplier)
-
-    # Compare to thresholds
-    thresholds = {
-        diff: get_party_threshold(party_levels, diff)
-        for diff in Difficulty
-    }
+    adjusted_xp = _adjusted_xp(total_xp, len(monsters))
 
-    if adjusted_xp >= thresholds[Difficulty.DEADLY]:
+    # Compare to thresholds, hardest first
+    deadly, hard, medium = _party_thresholds(tuple(sorted(party_levels)))
+    if adjusted_xp >= deadly:
         return Difficulty.DEADLY
-    elif adjusted_xp >= thresholds[Difficulty.HARD]:
+    elif adjusted_xp >= hard:
         return Difficulty.HARD
-    elif adjusted_xp >= thresholds[Difficulty.MEDIUM]:
+    elif adjusted_xp >= medium:
         return Difficulty.MEDIUM
     else:
         return Difficulty.EASY
@@ -161,19 +244,11 @@ def generate_encounter(
     avg_level = sum(party_levels) / len(party_levels)
 
     # CR range based on party level and difficulty
-    if difficulty == Difficulty.EASY:
-        max_cr = avg_level * 0.25
-    elif difficulty == Difficulty.MEDIUM:
-        max_cr = avg_level * 0.5
-    elif difficulty == Difficulty.HARD:
-        max_cr = avg_level * 0.75
-    else:  # Deadly
-        max_cr = avg_level
-
+    max_cr = avg_level * _CR_FACTOR[difficulty]
     max_cr = max(0.125, min(max_cr, 5))  # Clamp between 1/8 and 5
 
     # Get available monsters
-    available = get_monsters_by_cr_range(0, max_cr)
+    available = _monsters_in_cr_range(0, max_cr)
 
     # Filter by type if specified
     if monster_types:
@@ -181,13 +256,20 @@ def generate_encounter(
 
     if not available:
         # Fallback to any low-CR monster
-        available = get_monsters_by_cr_range(0, 1)
+        available = _monsters_in_cr_range(0, 1)
 
     if not available:
         # Ultimate fallback
-        available = list(MONSTERS.values())[:5]
+        available = list(itertools.islice(MONSTERS.values(), 5))
+
+    # Order candidates by XP so "weaker than X" is a prefix of the list
+    available = sorted(available, key=lambda m: get_cr_xp(m.cr))
+    available_xp = [get_cr_xp(m.cr) for m in available]
 
-    # Build encounter
+    # Build encounter, keeping a running XP total and adding the chosen
+    # monsters in one go at the end
+    chosen: List[Monster] = []
+    total_xp = 0
     current_xp = 0
     attempts = 0
     max_attempts = 50
@@ -197,30 +279,31 @@ def generate_encounter(
         monster_template = random.choice(available)
 
         # Check if adding it would exceed max
-        new_monster = monster_template.copy()
-        test_monsters = encounter.monsters + [new_monster]
-        test_xp = sum(get_cr_xp(m.cr) for m in test_monsters)
-        test_multiplier = get_encounter_multiplier(len(test_monsters))
-        test_adjusted = int(test_xp * test_multiplier)
+        test_xp = total_xp + get_cr_xp(monster_template.cr)
+        test_adjusted = _adjusted_xp(test_xp, len(chosen) + 1)
 
         if test_adjusted <= max_xp:
-            encounter.add_monster(new_monster)
-            current_xp = encounter.adjusted_xp
+            chosen.append(monster_template.copy())
+            total_xp = test_xp
+            current_xp = test_adjusted
         else:
             # Try a weaker monster
-            weaker = [m for m in available if get_cr_xp(m.cr) < get_cr_xp(monster_template.cr)]
-            if weaker:
-                available = weaker
+            cutoff = bisect.bisect_left(available_xp, get_cr_xp(monster_template.cr))
+            if cutoff:
+                available = available[:cutoff]
+                available_xp = available_xp[:cutoff]
 
         attempts += 1
 
+    encounter.add_monsters(chosen)
+
     # Set description
+    monster_names = list(dict.fromkeys(m.name for m in encounter.monsters))
     if len(encounter.monsters) == 1:
         encounter.description = f"A lone {encounter.monsters[0].name} blocks your path!"
-    elif len(set(m.name for m in encounter.monsters)) == 1:
-        encounter.description = f"A group of {len(encounter.monsters)} {encounter.monsters[0].name}s attacks!"
+    elif len(monster_names) == 1:
+        encounter.description = f"A group of {len(encounter.monsters)} {monster_names[0]}s attacks!"
     else:
-        monster_names = list(set(m.name for m in encounter.monsters))
         encounter.description = f"You face {', '.join(monster_names)}!"
 
     return encounter
@@ -244,14 +327,13 @@ def generate_boss_encounter(
         boss = get_monster(boss_name)
     else:
         # Find a suitable boss based on party level
-        boss_cr = avg_level * 0.75
-        candidates = get_monsters_by_cr_range(boss_cr - 0.5, boss_cr + 1)
+        boss_cr = avg_level * _BOSS_CR_FACTOR
+        candidates = _monsters_in_cr_range(boss_cr - 0.5, boss_cr + 1)
         if candidates:
             boss = random.choice(candidates).copy()
         else:
             # Fallback to strongest available
-            all_monsters = list(MONSTERS.values())
-            boss = max(all_monsters, key=lambda m: m.cr).copy()
+            boss = _strongest_monster(registry_version()).copy()
 
     if boss:
         encounter.add_monster(boss)
@@ -261,12 +343,13 @@ def generate_boss_encounter(
         if remaining_xp > 50:
             # Add some weaker minions
             minion_cr = max(0.125, boss.cr * 0.25)
-            minions = get_monsters_by_cr_range(0, minion_cr)
+            minions = _monsters_in_cr_range(0, minion_cr)
             if minions:
                 minion_template = random.choice(minions)
                 num_minions = min(4, remaining_xp // get_cr_xp(minion_template.cr))
-                for _ in range(int(num_minions)):
-                    encounter.add_monster(minion_template.copy())
+                encounter.add_monsters(
+                    minion_template.copy() for _ in range(int(num_minions))
+                )
 
         encounter.description = f"The {boss.name} awaits with its minions!"
 
@@ -308,8 +391,7 @@ def generate_encounter_from_template(template_name: str) -> Optional[Encounter]:
         if monster:
             min_count, max_count = entry["count"]
             count = random.randint(min_count, max_count)
-            for _ in range(count):
-                encounter.add_monster(monster.copy())
+            encounter.add_monsters(monster.copy() for _ in range(count))
 
     encounter.difficulty = Difficulty.MEDIUM  # Templates are designed for medium
     return encounter
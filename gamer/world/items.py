@@ -1,7 +1,7 @@
 """Items, weapons, armor, and equipment for D&D 5e."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from enum import Enum
 
 
@@ -31,7 +31,7 @@ class DamageType(Enum):
     PSYCHIC = "psychic"
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """A generic item."""
     name: str
@@ -58,7 +58,7 @@ class Item:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Weapon(Item):
     """A weapon."""
     damage: str = "1d4"  # dice notation
@@ -85,7 +85,7 @@ class Weapon(Item):
         return "light" in self.properties
 
     def to_dict(self) -> Dict:
-        data = super().to_dict()
+        data = Item.to_dict(self)
         data.update({
             'damage': self.damage,
             'damage_type': self.damage_type.value,
@@ -97,7 +97,7 @@ class Weapon(Item):
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class Armor(Item):
     """Armor and shields."""
     ac_base: int = 10
@@ -106,23 +106,25 @@ class Armor(Item):
     strength_requirement: int = 0
     stealth_disadvantage: bool = False
     armor_type: str = "light"  # light, medium, heavy, shield
+    _ac_fn: Optional[Callable[['Armor', int], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def calculate_ac(self, dex_modifier: int) -> int:
-        """Calculate AC with this armor."""
+    def __post_init__(self):
+        # Pick the AC rule for this kind of armor up front
         if self.armor_type == "shield":
-            return 2  # Shield bonus
-
-        if not self.ac_dex_bonus:
-            return self.ac_base
-
-        dex_bonus = dex_modifier
-        if self.ac_max_dex is not None:
-            dex_bonus = min(dex_modifier, self.ac_max_dex)
+            self._ac_fn = _shield_ac
+        elif not self.ac_dex_bonus:
+            self._ac_fn = _base_ac
+        else:
+            self._ac_fn = _dex_ac
 
-        return self.ac_base + dex_bonus
+    def calculate_ac(self, dex_modifier: int) -> int:
+        """Calculate AC with this armor."""
+        return self._ac_fn(self, dex_modifier)
 
     def to_dict(self) -> Dict:
-        data = super().to_dict()
+        data = Item.to_dict(self)
         data.update({
             'ac_base': self.ac_base,
             'ac_dex_bonus': self.ac_dex_bonus,
@@ -134,7 +136,24 @@ class Armor(Item):
         return data
 
 
-@dataclass
+def _shield_ac(armor: Armor, dex_modifier: int) -> int:
+    """AC rule for shields."""
+    return 2  # Shield bonus
+
+
+def _base_ac(armor: Armor, dex_modifier: int) -> int:
+    """AC rule for armor that ignores DEX."""
+    return armor.ac_base
+
+
+def _dex_ac(armor: Armor, dex_modifier: int) -> int:
+    """AC rule for armor that adds DEX, up to its cap if it has one."""
+    if armor.ac_max_dex is None:
+        return armor.ac_base + dex_modifier
+    return armor.ac_base + min(dex_modifier, armor.ac_max_dex)
+
+
+@dataclass(slots=True)
 class Potion(Item):
     """A potion or consumable."""
     effect: str = ""
@@ -144,46 +163,103 @@ class Potion(Item):
         self.consumable = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Treasure:
-    """Treasure and valuables."""
+    """Treasure and valuables.
+
+    Add valuables with add_gem, add_art_object and add_item so the running
+    total stays current. After changing gems, art_objects or items
+    directly, call invalidate_total.
+    """
     gold: int = 0
     silver: int = 0
     copper: int = 0
     gems: List[Dict[str, Any]] = field(default_factory=list)
     art_objects: List[Dict[str, Any]] = field(default_factory=list)
     items: List[Item] = field(default_factory=list)
+    # Running value of gems, art and items; None until first summed
+    _valuables_total: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def add_gem(self, gem: Dict[str, Any]) -> None:
+        """Add a gem to the hoard."""
+        self.gems.append(gem)
+        if self._valuables_total is not None:
+            self._valuables_total += gem.get('value', 0)
+
+    def add_art_object(self, art: Dict[str, Any]) -> None:
+        """Add an art object to the hoard."""
+        self.art_objects.append(art)
+        if self._valuables_total is not None:
+            self._valuables_total += art.get('value', 0)
+
+    def add_item(self, item: Item) -> None:
+        """Add an item to the hoard."""
+        self.items.append(item)
+        if self._valuables_total is not None:
+            self._valuables_total += item.value
+
+    def invalidate_total(self) -> None:
+        """Recount the valuables on the next read, after editing the lists directly."""
+        self._valuables_total = None
 
     @property
     def total_gold_value(self) -> float:
         """Calculate total value in gold."""
-        total = self.gold + self.silver / 10 + self.copper / 100
-        total += sum(g.get('value', 0) for g in self.gems)
-        total += sum(a.get('value', 0) for a in self.art_objects)
-        total += sum(i.value for i in self.items)
-        return total
+        if self._valuables_total is None:
+            valuables = sum(g.get('value', 0) for g in self.gems)
+            valuables += sum(a.get('value', 0) for a in self.art_objects)
+            valuables += sum(i.value for i in self.items)
+            self._valuables_total = valuables
+        return self.gold + self.silver / 10 + self.copper / 100 + self._valuables_total
 
 
-# Item databases
+# Item databases, filled in from the specs below the first time each is asked for
 WEAPONS: Dict[str, Weapon] = {}
 ARMORS: Dict[str, Armor] = {}
 ITEMS: Dict[str, Item] = {}
 
+_WEAPON_SPECS: Dict[str, Dict[str, Any]] = {}
+_ARMOR_SPECS: Dict[str, Dict[str, Any]] = {}
+_ITEM_SPECS: Dict[str, Dict[str, Any]] = {}
+
+
+def _register_weapon(spec: Dict[str, Any]) -> None:
+    _WEAPON_SPECS[spec['name'].lower()] = spec
+
+
+def _register_armor(spec: Dict[str, Any]) -> None:
+    _ARMOR_SPECS[spec['name'].lower()] = spec
+
 
-def _register_weapon(weapon: Weapon) -> None:
-    WEAPONS[weapon.name.lower()] = weapon
+def _register_item(spec: Dict[str, Any]) -> None:
+    _ITEM_SPECS[spec['name'].lower()] = spec
 
 
-def _register_armor(armor: Armor) -> None:
-    ARMORS[armor.name.lower()] = armor
+def _get_or_build(registry: Dict[str, Any], specs: Dict[str, Dict[str, Any]], cls: type, name: str) -> Any:
+    """Return the registered instance for name, building it on first use."""
+    # A lower-case key hits directly; only fold case when the exact name misses
+    obj = registry.get(name)
+    if obj is not None:
+        return obj
+    key = name.lower()
+    obj = registry.get(key)
+    if obj is None:
+        spec = specs.get(key)
+        if spec is None:
+            return None
+        obj = registry[key] = cls(**spec)
+    return obj
 
 
-def _register_item(item: Item) -> None:
-    ITEMS[item.name.lower()] = item
+def _build_all(registry: Dict[str, Any], specs: Dict[str, Dict[str, Any]], cls: type) -> List[Any]:
+    """Return every instance in registration order, building any still missing."""
+    return [_get_or_build(registry, specs, cls, key) for key in specs]
 
 
 # Simple Melee Weapons
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Club",
     description="A simple wooden club.",
     damage="1d4", damage_type=DamageType.BLUDGEONING,
@@ -191,7 +267,7 @@ _register_weapon(Weapon(
     weight=2, value=0.1,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Dagger",
     description="A small blade for close combat or throwing.",
     damage="1d4", damage_type=DamageType.PIERCING,
@@ -200,7 +276,7 @@ _register_weapon(Weapon(
     weight=1, value=2,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Greatclub",
     description="A large, heavy club.",
     damage="1d8", damage_type=DamageType.BLUDGEONING,
@@ -208,7 +284,7 @@ _register_weapon(Weapon(
     weight=10, value=0.2,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Handaxe",
     description="A light axe that can be thrown.",
     damage="1d6", damage_type=DamageType.SLASHING,
@@ -217,7 +293,7 @@ _register_weapon(Weapon(
     weight=2, value=5,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Javelin",
     description="A light spear designed for throwing.",
     damage="1d6", damage_type=DamageType.PIERCING,
@@ -226,7 +302,7 @@ _register_weapon(Weapon(
     weight=2, value=0.5,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Light Hammer",
     description="A small hammer that can be thrown.",
     damage="1d4", damage_type=DamageType.BLUDGEONING,
@@ -235,7 +311,7 @@ _register_weapon(Weapon(
     weight=2, value=2,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Mace",
     description="A heavy club with a metal head.",
     damage="1d6", damage_type=DamageType.BLUDGEONING,
@@ -243,7 +319,7 @@ _register_weapon(Weapon(
     weight=4, value=5,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Quarterstaff",
     description="A versatile wooden staff.",
     damage="1d6", damage_type=DamageType.BLUDGEONING,
@@ -252,7 +328,7 @@ _register_weapon(Weapon(
     weight=4, value=0.2,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Spear",
     description="A simple polearm.",
     damage="1d6", damage_type=DamageType.PIERCING,
@@ -263,7 +339,7 @@ _register_weapon(Weapon(
 ))
 
 # Simple Ranged Weapons
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Light Crossbow",
     description="A mechanical bow that fires bolts.",
     damage="1d8", damage_type=DamageType.PIERCING,
@@ -272,7 +348,7 @@ _register_weapon(Weapon(
     weight=5, value=25,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Shortbow",
     description="A small, simple bow.",
     damage="1d6", damage_type=DamageType.PIERCING,
@@ -282,7 +358,7 @@ _register_weapon(Weapon(
 ))
 
 # Martial Melee Weapons
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Battleaxe",
     description="A large axe designed for combat.",
     damage="1d8", damage_type=DamageType.SLASHING,
@@ -291,7 +367,7 @@ _register_weapon(Weapon(
     weight=4, value=10,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Greataxe",
     description="A massive two-handed axe.",
     damage="1d12", damage_type=DamageType.SLASHING,
@@ -299,7 +375,7 @@ _register_weapon(Weapon(
     weight=7, value=30,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Greatsword",
     description="A large two-handed sword.",
     damage="2d6", damage_type=DamageType.SLASHING,
@@ -307,7 +383,7 @@ _register_weapon(Weapon(
     weight=6, value=50,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Longsword",
     description="A versatile one-handed sword.",
     damage="1d8", damage_type=DamageType.SLASHING,
@@ -316,7 +392,7 @@ _register_weapon(Weapon(
     weight=3, value=15,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Rapier",
     description="A slender thrusting sword.",
     damage="1d8", damage_type=DamageType.PIERCING,
@@ -324,7 +400,7 @@ _register_weapon(Weapon(
     weight=2, value=25,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Scimitar",
     description="A curved blade favored by sailors.",
     damage="1d6", damage_type=DamageType.SLASHING,
@@ -332,7 +408,7 @@ _register_weapon(Weapon(
     weight=3, value=25,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Shortsword",
     description="A short, versatile blade.",
     damage="1d6", damage_type=DamageType.PIERCING,
@@ -340,7 +416,7 @@ _register_weapon(Weapon(
     weight=2, value=10,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Warhammer",
     description="A heavy hammer for combat.",
     damage="1d8", damage_type=DamageType.BLUDGEONING,
@@ -350,7 +426,7 @@ _register_weapon(Weapon(
 ))
 
 # Martial Ranged Weapons
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Hand Crossbow",
     description="A small crossbow that can be used one-handed.",
     damage="1d6", damage_type=DamageType.PIERCING,
@@ -359,7 +435,7 @@ _register_weapon(Weapon(
     weight=3, value=75,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Heavy Crossbow",
     description="A powerful mechanical crossbow.",
     damage="1d10", damage_type=DamageType.PIERCING,
@@ -368,7 +444,7 @@ _register_weapon(Weapon(
     weight=18, value=50,
 ))
 
-_register_weapon(Weapon(
+_register_weapon(dict(
     name="Longbow",
     description="A tall bow with excellent range.",
     damage="1d8", damage_type=DamageType.PIERCING,
@@ -378,7 +454,7 @@ _register_weapon(Weapon(
 ))
 
 # Light Armor
-_register_armor(Armor(
+_register_armor(dict(
     name="Padded",
     description="Quilted layers of cloth and batting.",
     ac_base=11, ac_dex_bonus=True,
@@ -387,7 +463,7 @@ _register_armor(Armor(
     weight=8, value=5,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Leather",
     description="Basic leather armor.",
     ac_base=11, ac_dex_bonus=True,
@@ -395,7 +471,7 @@ _register_armor(Armor(
     weight=10, value=10,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Studded Leather",
     description="Leather reinforced with metal rivets.",
     ac_base=12, ac_dex_bonus=True,
@@ -404,7 +480,7 @@ _register_armor(Armor(
 ))
 
 # Medium Armor
-_register_armor(Armor(
+_register_armor(dict(
     name="Hide",
     description="Crude armor made from thick hides.",
     ac_base=12, ac_dex_bonus=True, ac_max_dex=2,
@@ -412,7 +488,7 @@ _register_armor(Armor(
     weight=12, value=10,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Chain Shirt",
     description="A shirt of interlocking metal rings.",
     ac_base=13, ac_dex_bonus=True, ac_max_dex=2,
@@ -420,7 +496,7 @@ _register_armor(Armor(
     weight=20, value=50,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Scale Mail",
     description="Armor made of overlapping metal scales.",
     ac_base=14, ac_dex_bonus=True, ac_max_dex=2,
@@ -429,7 +505,7 @@ _register_armor(Armor(
     weight=45, value=50,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Breastplate",
     description="A fitted metal chest piece.",
     ac_base=14, ac_dex_bonus=True, ac_max_dex=2,
@@ -437,7 +513,7 @@ _register_armor(Armor(
     weight=20, value=400,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Half Plate",
     description="Partial plate armor covering vital areas.",
     ac_base=15, ac_dex_bonus=True, ac_max_dex=2,
@@ -447,7 +523,7 @@ _register_armor(Armor(
 ))
 
 # Heavy Armor
-_register_armor(Armor(
+_register_armor(dict(
     name="Ring Mail",
     description="Leather armor with metal rings sewn on.",
     ac_base=14, ac_dex_bonus=False,
@@ -456,7 +532,7 @@ _register_armor(Armor(
     weight=40, value=30,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Chain Mail",
     description="Full suit of interlocking metal rings.",
     ac_base=16, ac_dex_bonus=False,
@@ -466,7 +542,7 @@ _register_armor(Armor(
     weight=55, value=75,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Splint",
     description="Armor made of metal strips.",
     ac_base=17, ac_dex_bonus=False,
@@ -476,7 +552,7 @@ _register_armor(Armor(
     weight=60, value=200,
 ))
 
-_register_armor(Armor(
+_register_armor(dict(
     name="Plate",
     description="Full suit of plate armor.",
     ac_base=18, ac_dex_bonus=False,
@@ -487,7 +563,7 @@ _register_armor(Armor(
 ))
 
 # Shield
-_register_armor(Armor(
+_register_armor(dict(
     name="Shield",
     description="A wooden or metal shield.",
     ac_base=2, ac_dex_bonus=False,
@@ -496,61 +572,61 @@ _register_armor(Armor(
 ))
 
 # Adventuring Gear
-_register_item(Item(
+_register_item(dict(
     name="Torch",
     description="Provides bright light in 20-foot radius, dim light for 20 more. Burns for 1 hour.",
     weight=1, value=0.01,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Rope (50 feet)",
     description="Hemp rope, 50 feet.",
     weight=10, value=1,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Rations (1 day)",
     description="Dried food for one day.",
     weight=2, value=0.5, consumable=True,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Waterskin",
     description="Holds 4 pints of liquid.",
     weight=5, value=0.2,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Backpack",
     description="Can hold 1 cubic foot or 30 pounds of gear.",
     weight=5, value=2,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Bedroll",
     description="A sleeping roll for camping.",
     weight=7, value=1,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Tinderbox",
     description="Flint, fire steel, and tinder for starting fires.",
     weight=1, value=0.5,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Thieves' Tools",
     description="A set of lockpicks and tools for disabling traps.",
     weight=1, value=25,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Holy Symbol",
     description="A symbol of a deity.",
     weight=1, value=5,
 ))
 
-_register_item(Item(
+_register_item(dict(
     name="Component Pouch",
     description="A pouch for spell components.",
     weight=2, value=25,
@@ -558,13 +634,14 @@ _register_item(Item(
 
 # Potions
 POTIONS: Dict[str, Potion] = {}
+_POTION_SPECS: Dict[str, Dict[str, Any]] = {}
 
 
-def _register_potion(potion: Potion) -> None:
-    POTIONS[potion.name.lower()] = potion
+def _register_potion(spec: Dict[str, Any]) -> None:
+    _POTION_SPECS[spec['name'].lower()] = spec
 
 
-_register_potion(Potion(
+_register_potion(dict(
     name="Potion of Healing",
     description="Regain 2d4+2 hit points.",
     healing="2d4+2",
@@ -574,7 +651,7 @@ _register_potion(Potion(
     magical=True,
 ))
 
-_register_potion(Potion(
+_register_potion(dict(
     name="Potion of Greater Healing",
     description="Regain 4d4+4 hit points.",
     healing="4d4+4",
@@ -584,7 +661,7 @@ _register_potion(Potion(
     magical=True,
 ))
 
-_register_potion(Potion(
+_register_potion(dict(
     name="Antitoxin",
     description="Advantage on saves vs. poison for 1 hour.",
     effect="poison_resistance",
@@ -594,34 +671,34 @@ _register_potion(Potion(
 
 def get_weapon(name: str) -> Optional[Weapon]:
     """Get a weapon by name."""
-    return WEAPONS.get(name.lower())
+    return _get_or_build(WEAPONS, _WEAPON_SPECS, Weapon, name)
 
 
 def get_armor(name: str) -> Optional[Armor]:
     """Get armor by name."""
-    return ARMORS.get(name.lower())
+    return _get_or_build(ARMORS, _ARMOR_SPECS, Armor, name)
 
 
 def get_item(name: str) -> Optional[Item]:
     """Get an item by name."""
-    return ITEMS.get(name.lower())
+    return _get_or_build(ITEMS, _ITEM_SPECS, Item, name)
 
 
 def get_potion(name: str) -> Optional[Potion]:
     """Get a potion by name."""
-    return POTIONS.get(name.lower())
+    return _get_or_build(POTIONS, _POTION_SPECS, Potion, name)
 
 
 def get_all_weapons() -> List[Weapon]:
     """Get all weapons."""
-    return list(WEAPONS.values())
+    return _build_all(WEAPONS, _WEAPON_SPECS, Weapon)
 
 
 def get_all_armors() -> List[Armor]:
     """Get all armor."""
-    return list(ARMORS.values())
+    return _build_all(ARMORS, _ARMOR_SPECS, Armor)
 
 
 def get_all_items() -> List[Item]:
     """Get all items."""
-    return list(ITEMS.values())
+    return _build_all(ITEMS, _ITEM_SPECS, Item)
@@ -1,13 +1,48 @@
 """Monster stat blocks for D&D 5e."""
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
-import uuid
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Collection, Sequence, Tuple
+import bisect
+import functools
+import itertools
+import sys
 
 from ..characters.abilities import Ability
+from ..characters.skills import SKILLS
 
 
-@dataclass
+# Modifier attribute and saving_throws key for each ability
+_ABILITY_STAT: Dict[Ability, Tuple[str, str]] = {
+    Ability.STRENGTH: ('str_modifier', 'str'),
+    Ability.DEXTERITY: ('dex_modifier', 'dex'),
+    Ability.CONSTITUTION: ('con_modifier', 'con'),
+    Ability.INTELLIGENCE: ('int_modifier', 'int'),
+    Ability.WISDOM: ('wis_modifier', 'wis'),
+    Ability.CHARISMA: ('cha_modifier', 'cha'),
+}
+
+
+# Monster ids only need to be unique within a run, so a counter will do
+_monster_ids = itertools.count(1)
+
+
+def _new_monster_id() -> str:
+    """Return a fresh monster instance id."""
+    return f"m{next(_monster_ids)}"
+
+
+# Proficiency bonus steps up at each of these CRs
+_PROF_CR_THRESHOLDS = (5, 9, 13, 17)
+_PROF_BONUSES = (2, 3, 4, 5, 6)
+
+
+def _proficiency_bonus(cr: float) -> int:
+    """Calculate proficiency bonus from CR."""
+    return _PROF_BONUSES[bisect.bisect_right(_PROF_CR_THRESHOLDS, cr)]
+
+
+@dataclass(slots=True)
 class MonsterAction:
     """An action a monster can take."""
     name: str
@@ -20,14 +55,14 @@ class MonsterAction:
     range: int = 0  # for ranged attacks
 
 
-@dataclass
+@dataclass(slots=True)
 class MonsterTrait:
     """A special trait or ability."""
     name: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Monster:
     """A monster stat block."""
     name: str
@@ -48,59 +83,55 @@ class Monster:
     charisma: int = 10
 
     # Combat
-    actions: List[MonsterAction] = field(default_factory=list)
-    traits: List[MonsterTrait] = field(default_factory=list)
+    actions: Sequence[MonsterAction] = field(default_factory=list)
+    traits: Sequence[MonsterTrait] = field(default_factory=list)
 
     # Proficiencies
     saving_throws: List[str] = field(default_factory=list)  # e.g., ["dex", "wis"]
     skills: Dict[str, int] = field(default_factory=dict)  # skill: bonus
 
     # Resistances/immunities
-    damage_resistances: List[str] = field(default_factory=list)
-    damage_immunities: List[str] = field(default_factory=list)
-    condition_immunities: List[str] = field(default_factory=list)
+    damage_resistances: Collection[str] = field(default_factory=list)
+    damage_immunities: Collection[str] = field(default_factory=list)
+    condition_immunities: Collection[str] = field(default_factory=list)
 
     # Senses
     darkvision: int = 0
     passive_perception: int = 10
 
     # Languages
-    languages: List[str] = field(default_factory=list)
+    languages: Sequence[str] = field(default_factory=list)
 
     # XP reward
     xp: int = 0
 
     # Instance state
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_monster_id)
     current_hp: int = 0
 
+    # Derived from the scores and CR by recompute_modifiers()
+    str_modifier: int = field(default=0, init=False, repr=False, compare=False)
+    dex_modifier: int = field(default=0, init=False, repr=False, compare=False)
+    con_modifier: int = field(default=0, init=False, repr=False, compare=False)
+    int_modifier: int = field(default=0, init=False, repr=False, compare=False)
+    wis_modifier: int = field(default=0, init=False, repr=False, compare=False)
+    cha_modifier: int = field(default=0, init=False, repr=False, compare=False)
+    proficiency_bonus: int = field(default=2, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.current_hp == 0:
             self.current_hp = self.max_hp
-
-    @property
-    def str_modifier(self) -> int:
-        return (self.strength - 10) // 2
-
-    @property
-    def dex_modifier(self) -> int:
-        return (self.dexterity - 10) // 2
-
-    @property
-    def con_modifier(self) -> int:
-        return (self.constitution - 10) // 2
-
-    @property
-    def int_modifier(self) -> int:
-        return (self.intelligence - 10) // 2
-
-    @property
-    def wis_modifier(self) -> int:
-        return (self.wisdom - 10) // 2
-
-    @property
-    def cha_modifier(self) -> int:
-        return (self.charisma - 10) // 2
+        self.recompute_modifiers()
+
+    def recompute_modifiers(self) -> None:
+        """Refresh cached modifiers; call after changing ability scores or CR."""
+        self.str_modifier = (self.strength - 10) // 2
+        self.dex_modifier = (self.dexterity - 10) // 2
+        self.con_modifier = (self.constitution - 10) // 2
+        self.int_modifier = (self.intelligence - 10) // 2
+        self.wis_modifier = (self.wisdom - 10) // 2
+        self.cha_modifier = (self.charisma - 10) // 2
+        self.proficiency_bonus = _proficiency_bonus(self.cr)
 
     @property
     def armor_class(self) -> int:
@@ -110,22 +141,10 @@ class Monster:
     def is_alive(self) -> bool:
         return self.current_hp > 0
 
-    @property
-    def proficiency_bonus(self) -> int:
-        """Calculate proficiency bonus from CR."""
-        if self.cr < 5:
-            return 2
-        elif self.cr < 9:
-            return 3
-        elif self.cr < 13:
-            return 4
-        elif self.cr < 17:
-            return 5
-        else:
-            return 6
-
-    def take_damage(self, amount: int) -> Dict[str, Any]:
-        """Take damage."""
+    def take_damage(self, amount: int, damage_type: str = "") -> Dict[str, Any]:
+        """Take damage, ignoring it entirely if immune to damage_type."""
+        if damage_type and damage_type in self.damage_immunities:
+            amount = 0
         old_hp = self.current_hp
         self.current_hp = max(0, self.current_hp - amount)
         return {
@@ -149,21 +168,24 @@ class Monster:
 
     def get_saving_throw_modifier(self, ability: Ability) -> int:
         """Get modifier for a saving throw."""
-        ability_mod = {
-            Ability.STRENGTH: self.str_modifier,
-            Ability.DEXTERITY: self.dex_modifier,
-            Ability.CONSTITUTION: self.con_modifier,
-            Ability.INTELLIGENCE: self.int_modifier,
-            Ability.WISDOM: self.wis_modifier,
-            Ability.CHARISMA: self.cha_modifier,
-        }.get(ability, 0)
+        modifier, ability_short = _ABILITY_STAT[ability]
+        ability_mod = getattr(self, modifier)
 
         # Check for proficiency
-        ability_short = ability.value.lower()
         if ability_short in self.saving_throws:
             return ability_mod + self.proficiency_bonus
         return ability_mod
 
+    def get_skill_bonus(self, skill: str) -> int:
+        """Get the bonus for a skill, falling back to its ability modifier."""
+        bonus = self.skills.get(skill)
+        if bonus is not None:
+            return bonus
+        skill_info = SKILLS.get(skill)
+        if skill_info is None:
+            return 0
+        return getattr(self, _ABILITY_STAT[skill_info.ability][0])
+
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
         return {
@@ -175,20 +197,118 @@ class Monster:
 
     def copy(self) -> 'Monster':
         """Create a copy with a new ID."""
-        import copy
-        new_monster = copy.deepcopy(self)
-        new_monster.id = str(uuid.uuid4())
-        new_monster.current_hp = new_monster.max_hp
+        # Copy every slot straight across, skipping __init__ and
+        # __post_init__ (the cached modifiers are already right). Clones
+        # share the tuples and frozensets; saves and skills get fresh
+        # containers so a clone can't change its template
+        new_monster = object.__new__(Monster)
+        for name, value in zip(_MONSTER_FIELDS, _get_monster_fields(self)):
+            setattr(new_monster, name, value)
+        new_monster.id = _new_monster_id()
+        new_monster.current_hp = self.max_hp
+        new_monster.actions = tuple(self.actions)
+        new_monster.traits = tuple(self.traits)
+        new_monster.saving_throws = list(self.saving_throws)
+        new_monster.skills = dict(self.skills)
+        new_monster.damage_resistances = frozenset(self.damage_resistances)
+        new_monster.damage_immunities = frozenset(self.damage_immunities)
+        new_monster.condition_immunities = frozenset(self.condition_immunities)
+        new_monster.languages = tuple(self.languages)
         return new_monster
 
 
+# Every Monster field, read in one call by Monster.copy
+_MONSTER_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(Monster))
+_get_monster_fields = attrgetter(*_MONSTER_FIELDS)
+
+
 # Monster database
 MONSTERS: Dict[str, Monster] = {}
 
 
+# Monsters grouped by CR, with the CRs kept sorted for range queries
+_CR_INDEX: Dict[float, List[Monster]] = {}
+_CR_KEYS_SORTED: List[float] = []
+
+
+def _intern_strings(monster: Monster) -> None:
+    """Intern the small vocabularies repeated across stat blocks.
+
+    The string collections come back frozen (frozensets for the
+    membership-tested resistances and immunities, a tuple of languages),
+    ready to be shared by clones. Skills stay a plain dict, which clones
+    copy.
+    """
+    intern = sys.intern
+    monster.size = intern(monster.size)
+    monster.monster_type = intern(monster.monster_type)
+    monster.alignment = intern(monster.alignment)
+    monster.saving_throws = [intern(s) for s in monster.saving_throws]
+    monster.skills = {intern(k): v for k, v in monster.skills.items()}
+    monster.damage_resistances = frozenset(intern(s) for s in monster.damage_resistances)
+    monster.damage_immunities = frozenset(intern(s) for s in monster.damage_immunities)
+    monster.condition_immunities = frozenset(intern(s) for s in monster.condition_immunities)
+    monster.languages = tuple(intern(s) for s in monster.languages)
+    for action in monster.actions:
+        action.damage_type = intern(action.damage_type)
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup_template(name: str) -> Optional[Monster]:
+    """Find the registered template for a name, ignoring case."""
+    # A lower-case key hits directly; only fold case when the exact name misses
+    template = MONSTERS.get(name)
+    if template is None:
+        template = MONSTERS.get(name.lower())
+    return template
+
+
+@functools.lru_cache(maxsize=1)
+def _all_templates() -> Tuple[Monster, ...]:
+    """Every registered template, in registration order."""
+    return tuple(MONSTERS.values())
+
+
+@functools.lru_cache(maxsize=1)
+def _template_names() -> Tuple[str, ...]:
+    """Display names of every registered template."""
+    return tuple(m.name for m in MONSTERS.values())
+
+
+# Bumped by every registration, including re-registering an existing name
+_registry_version = 0
+
+
+def registry_version() -> int:
+    """Counter that changes whenever a monster template is registered.
+
+    Caches built from MONSTERS can key on it to notice added or replaced
+    templates.
+    """
+    return _registry_version
+
+
 def _register_monster(monster: Monster) -> None:
     """Register a monster in the database."""
-    MONSTERS[monster.name.lower()] = monster
+    global _registry_version
+    _registry_version += 1
+    _lookup_template.cache_clear()
+    _all_templates.cache_clear()
+    _template_names.cache_clear()
+    # Templates are never edited, so freeze their fixed lists for sharing
+    monster.actions = tuple(monster.actions)
+    monster.traits = tuple(monster.traits)
+    _intern_strings(monster)
+    key = monster.name.lower()
+    old = MONSTERS.get(key)
+    if old is not None:
+        _CR_INDEX[old.cr].remove(old)
+    MONSTERS[key] = monster
+    bucket = _CR_INDEX.get(monster.cr)
+    if bucket is None:
+        bucket = _CR_INDEX[monster.cr] = []
+        bisect.insort(_CR_KEYS_SORTED, monster.cr)
+    bucket.append(monster)
 
 
 # CR 0 - 1/8
@@ -504,7 +624,7 @@ _register_monster(Monster(
 
 def get_monster(name: str) -> Optional[Monster]:
     """Get a monster by name. Returns a new instance."""
-    template = MONSTERS.get(name.lower())
+    template = _lookup_template(name)
     if template:
         return template.copy()
     return None
@@ -512,19 +632,23 @@ def get_monster(name: str) -> Optional[Monster]:
 
 def get_monsters_by_cr(cr: float) -> List[Monster]:
     """Get all monsters of a specific CR."""
-    return [m for m in MONSTERS.values() if m.cr == cr]
+    return list(_CR_INDEX.get(cr, ()))
 
 
 def get_monsters_by_cr_range(min_cr: float, max_cr: float) -> List[Monster]:
     """Get all monsters within a CR range."""
-    return [m for m in MONSTERS.values() if min_cr <= m.cr <= max_cr]
+    lo = bisect.bisect_left(_CR_KEYS_SORTED, min_cr)
+    hi = bisect.bisect_right(_CR_KEYS_SORTED, max_cr)
+    return list(itertools.chain.from_iterable(
+        _CR_INDEX[cr] for cr in _CR_KEYS_SORTED[lo:hi]
+    ))
 
 
 def get_all_monsters() -> List[Monster]:
     """Get all monsters."""
-    return list(MONSTERS.values())
+    return list(_all_templates())
 
 
 def get_monster_names() -> List[str]:
     """Get all monster names."""
-    return [m.name for m in MONSTERS.values()]
+    return list(_template_names())
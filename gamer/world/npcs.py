@@ -1,19 +1,23 @@
 """NPC generation and dialogue for D&D 5e."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
-from enum import Enum
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from enum import Enum, IntEnum
 import random
-import uuid
+import string
 
 
-class NPCAttitude(Enum):
-    """NPC attitude toward players."""
-    HOSTILE = "Hostile"
-    UNFRIENDLY = "Unfriendly"
-    INDIFFERENT = "Indifferent"
-    FRIENDLY = "Friendly"
-    HELPFUL = "Helpful"
+class NPCAttitude(IntEnum):
+    """NPC attitude toward players, ordered from worst to best."""
+    HOSTILE = 0
+    UNFRIENDLY = 1
+    INDIFFERENT = 2
+    FRIENDLY = 3
+    HELPFUL = 4
+
+
+# Display label for each attitude, indexed by its value
+_ATTITUDE_LABEL: Tuple[str, ...] = ("Hostile", "Unfriendly", "Indifferent", "Friendly", "Helpful")
 
 
 class NPCRole(Enum):
@@ -32,23 +36,94 @@ class NPCRole(Enum):
     QUEST_GIVER = "Quest Giver"
 
 
-@dataclass
+# Serialized label for each role, for to_dict
+_ROLE_VALUE: Dict[NPCRole, str] = {r: r.value for r in NPCRole}
+
+
+# Greetings an NPC picks from when it has no fixed greeting
+_GREETINGS_BY_ATTITUDE: Dict[NPCAttitude, Tuple[str, ...]] = {
+    NPCAttitude.HOSTILE: (
+        "What do you want?",
+        "Get out of my sight!",
+        "You've got some nerve showing your face here.",
+    ),
+    NPCAttitude.UNFRIENDLY: (
+        "Make it quick.",
+        "I don't have time for this.",
+        "*sigh* What is it?",
+    ),
+    NPCAttitude.INDIFFERENT: (
+        "Can I help you?",
+        "Yes?",
+        "What brings you here?",
+    ),
+    NPCAttitude.FRIENDLY: (
+        "Well met, traveler!",
+        "Good to see you!",
+        "Welcome, friend!",
+    ),
+    NPCAttitude.HELPFUL: (
+        "Ah, perfect timing! I was hoping to see you.",
+        "My friend! How can I assist you?",
+        "Welcome! I have something that might interest you.",
+    ),
+}
+_DEFAULT_GREETING: Tuple[str, ...] = ("Hello.",)
+
+
 class DialogueLine:
-    """A line of NPC dialogue."""
-    text: str
-    condition: Optional[str] = None  # Condition for this line to appear
-    responses: List['DialogueResponse'] = field(default_factory=list)
+    """A line of NPC dialogue.
+
+    Written by hand rather than as a dataclass because NPCs create many of
+    these; lines without responses share one empty tuple.
+    """
+    __slots__ = ("text", "condition", "responses")
+
+    def __init__(
+        self,
+        text: str,
+        condition: Optional[str] = None,  # Condition for this line to appear
+        responses: Optional[Sequence['DialogueResponse']] = None
+    ):
+        self.text = text
+        self.condition = condition
+        self.responses: Sequence[DialogueResponse] = responses or ()
+
+    def __repr__(self) -> str:
+        return f"DialogueLine(text={self.text!r}, condition={self.condition!r}, responses={self.responses!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not DialogueLine:
+            return NotImplemented
+        return (self.text, self.condition, tuple(self.responses)) == \
+            (other.text, other.condition, tuple(other.responses))
 
 
-@dataclass
 class DialogueResponse:
     """A player response option."""
-    text: str
-    next_dialogue: Optional[str] = None  # Key to next dialogue
-    effect: Optional[str] = None  # Effect of choosing this response
+    __slots__ = ("text", "next_dialogue", "effect")
+
+    def __init__(
+        self,
+        text: str,
+        next_dialogue: Optional[str] = None,  # Key to next dialogue
+        effect: Optional[str] = None  # Effect of choosing this response
+    ):
+        self.text = text
+        self.next_dialogue = next_dialogue
+        self.effect = effect
+
+    def __repr__(self) -> str:
+        return f"DialogueResponse(text={self.text!r}, next_dialogue={self.next_dialogue!r}, effect={self.effect!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not DialogueResponse:
+            return NotImplemented
+        return (self.text, self.next_dialogue, self.effect) == \
+            (other.text, other.next_dialogue, other.effect)
 
 
-@dataclass
+@dataclass(slots=True)
 class Quest:
     """A quest that can be given by an NPC."""
     id: str
@@ -61,7 +136,7 @@ class Quest:
     completed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NPC:
     """A non-player character."""
     id: str
@@ -93,69 +168,30 @@ class NPC:
         if self.greeting:
             return self.greeting
 
-        greetings = {
-            NPCAttitude.HOSTILE: [
-                "What do you want?",
-                "Get out of my sight!",
-                "You've got some nerve showing your face here.",
-            ],
-            NPCAttitude.UNFRIENDLY: [
-                "Make it quick.",
-                "I don't have time for this.",
-                "*sigh* What is it?",
-            ],
-            NPCAttitude.INDIFFERENT: [
-                "Can I help you?",
-                "Yes?",
-                "What brings you here?",
-            ],
-            NPCAttitude.FRIENDLY: [
-                "Well met, traveler!",
-                "Good to see you!",
-                "Welcome, friend!",
-            ],
-            NPCAttitude.HELPFUL: [
-                "Ah, perfect timing! I was hoping to see you.",
-                "My friend! How can I assist you?",
-                "Welcome! I have something that might interest you.",
-            ],
-        }
-
-        return random.choice(greetings.get(self.attitude, ["Hello."]))
+        return random.choice(_GREETINGS_BY_ATTITUDE.get(self.attitude, _DEFAULT_GREETING))
 
     def get_dialogue(self, key: str = "start") -> Optional[DialogueLine]:
-        """Get a dialogue line by key."""
-        return self.dialogue_tree.get(key)
+        """Get a dialogue line by key, building basic lines on first use."""
+        line = self.dialogue_tree.get(key)
+        if line is None:
+            builder = _DIALOGUE_BUILDERS.get(key)
+            if builder:
+                line = builder(self)
+                if line is not None:
+                    self.dialogue_tree[key] = line
+        return line
 
     def improve_attitude(self) -> bool:
         """Try to improve NPC attitude. Returns True if improved."""
-        attitude_order = [
-            NPCAttitude.HOSTILE,
-            NPCAttitude.UNFRIENDLY,
-            NPCAttitude.INDIFFERENT,
-            NPCAttitude.FRIENDLY,
-            NPCAttitude.HELPFUL,
-        ]
-
-        current_index = attitude_order.index(self.attitude)
-        if current_index < len(attitude_order) - 1:
-            self.attitude = attitude_order[current_index + 1]
+        if self.attitude < NPCAttitude.HELPFUL:
+            self.attitude = NPCAttitude(self.attitude + 1)
             return True
         return False
 
     def worsen_attitude(self) -> bool:
         """Worsen NPC attitude. Returns True if worsened."""
-        attitude_order = [
-            NPCAttitude.HOSTILE,
-            NPCAttitude.UNFRIENDLY,
-            NPCAttitude.INDIFFERENT,
-            NPCAttitude.FRIENDLY,
-            NPCAttitude.HELPFUL,
-        ]
-
-        current_index = attitude_order.index(self.attitude)
-        if current_index > 0:
-            self.attitude = attitude_order[current_index - 1]
+        if self.attitude > NPCAttitude.HOSTILE:
+            self.attitude = NPCAttitude(self.attitude - 1)
             return True
         return False
 
@@ -164,10 +200,10 @@ class NPC:
         return {
             'id': self.id,
             'name': self.name,
-            'role': self.role.value,
+            'role': _ROLE_VALUE[self.role],
             'race': self.race,
             'description': self.description,
-            'attitude': self.attitude.value,
+            'attitude': _ATTITUDE_LABEL[self.attitude],
             'inventory': self.inventory,
             'gold': self.gold,
         }
@@ -176,30 +212,52 @@ class NPC:
 # Name generators
 FIRST_NAMES = {
     "human": {
-        "male": ["Aldric", "Bram", "Cedric", "Dorian", "Edmund", "Finn", "Gareth", "Hugo"],
-        "female": ["Adeline", "Brenna", "Clara", "Diana", "Elena", "Fiona", "Gwendolyn", "Helena"],
+        "male": ("Aldric", "Bram", "Cedric", "Dorian", "Edmund", "Finn", "Gareth", "Hugo"),
+        "female": ("Adeline", "Brenna", "Clara", "Diana", "Elena", "Fiona", "Gwendolyn", "Helena"),
     },
     "elf": {
-        "male": ["Aelindor", "Caelum", "Eldrin", "Faenor", "Galathil", "Ithelan", "Lyran", "Thaelon"],
-        "female": ["Aelindra", "Caelia", "Elara", "Faelwen", "Galadria", "Ithilwen", "Lyria", "Thaelwen"],
+        "male": ("Aelindor", "Caelum", "Eldrin", "Faenor", "Galathil", "Ithelan", "Lyran", "Thaelon"),
+        "female": ("Aelindra", "Caelia", "Elara", "Faelwen", "Galadria", "Ithilwen", "Lyria", "Thaelwen"),
     },
     "dwarf": {
-        "male": ["Balin", "Dain", "Fargrim", "Gundren", "Harbek", "Kildrak", "Morgran", "Thorin"],
-        "female": ["Amber", "Bardryn", "Diesa", "Eldeth", "Gunnloda", "Helja", "Kathra", "Riswynn"],
+        "male": ("Balin", "Dain", "Fargrim", "Gundren", "Harbek", "Kildrak", "Morgran", "Thorin"),
+        "female": ("Amber", "Bardryn", "Diesa", "Eldeth", "Gunnloda", "Helja", "Kathra", "Riswynn"),
     },
     "halfling": {
-        "male": ["Alton", "Cade", "Eldon", "Garrett", "Lyle", "Merric", "Osborn", "Roscoe"],
-        "female": ["Andry", "Bree", "Cora", "Euphemia", "Jillian", "Kithri", "Lavinia", "Portia"],
+        "male": ("Alton", "Cade", "Eldon", "Garrett", "Lyle", "Merric", "Osborn", "Roscoe"),
+        "female": ("Andry", "Bree", "Cora", "Euphemia", "Jillian", "Kithri", "Lavinia", "Portia"),
     },
 }
 
 LAST_NAMES = {
-    "human": ["Ashford", "Blackwood", "Coldwell", "Dunmore", "Fairfax", "Greenleaf", "Hartley", "Ironside"],
-    "elf": ["Amastacia", "Galanodel", "Holimion", "Liadon", "Meliamne", "Nailo", "Siannodel", "Xiloscient"],
-    "dwarf": ["Battlehammer", "Boulderstone", "Dankil", "Fireforge", "Ironfist", "Loderr", "Rumnaheim", "Torunn"],
-    "halfling": ["Brushgather", "Goodbarrel", "Greenbottle", "High-hill", "Hilltopple", "Leagallow", "Tealeaf", "Thorngage"],
+    "human": ("Ashford", "Blackwood", "Coldwell", "Dunmore", "Fairfax", "Greenleaf", "Hartley", "Ironside"),
+    "elf": ("Amastacia", "Galanodel", "Holimion", "Liadon", "Meliamne", "Nailo", "Siannodel", "Xiloscient"),
+    "dwarf": ("Battlehammer", "Boulderstone", "Dankil", "Fireforge", "Ironfist", "Loderr", "Rumnaheim", "Torunn"),
+    "halfling": ("Brushgather", "Goodbarrel", "Greenbottle", "High-hill", "Hilltopple", "Leagallow", "Tealeaf", "Thorngage"),
 }
 
+# First names keyed by (race, gender)
+_FIRST_NAMES_FLAT: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    (race, gender): names
+    for race, by_gender in FIRST_NAMES.items()
+    for gender, names in by_gender.items()
+}
+
+# Separate generator for ids, so making NPCs with the module random seeded
+# does not repeat ids across runs and ids do not consume game randomness
+_id_rng = random.Random()
+
+
+def _new_id() -> str:
+    """Return a random 64-bit hex id for an NPC or quest."""
+    return f"{_id_rng.getrandbits(64):016x}"
+
+
+# Random NPC races (humans three times as common) and genders
+_NPC_RACES: Tuple[str, ...] = ("human", "elf", "dwarf", "halfling")
+_NPC_RACE_CUM_WEIGHTS: Tuple[int, ...] = (3, 4, 5, 6)
+_GENDERS: Tuple[str, ...] = ("male", "female")
+
 # NPC templates
 NPC_TEMPLATES: Dict[NPCRole, Dict] = {
     NPCRole.MERCHANT: {
@@ -285,19 +343,66 @@ QUEST_TEMPLATES = [
     },
 ]
 
+# Values for the quest template placeholders
+_QUEST_LOCATIONS = ("old mine", "abandoned tower", "dark cave", "ruined temple")
+_QUEST_ENEMIES = ("goblins", "bandits", "undead", "orcs")
+_QUEST_ITEMS = ("ancient artifact", "stolen heirloom", "sacred relic", "merchant's goods")
+_QUEST_PEOPLE = ("a merchant", "a noble's child", "a priest", "a scholar")
+
+
+def _parse_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a format string into (literal, placeholder) pairs."""
+    return tuple((literal, key) for literal, key, _, _ in string.Formatter().parse(template))
+
+
+def _fill(parsed: Tuple[Tuple[str, Optional[str]], ...], ctx: Dict[str, str]) -> str:
+    """Rebuild a string parsed by _parse_template from ctx."""
+    return "".join(literal + (ctx[key] if key else "") for literal, key in parsed)
+
+
+# Quest templates paired with their parsed name, description and objectives
+_PARSED_QUEST_TEMPLATES = [
+    (template, _parse_template(template["name"]), _parse_template(template["description"]),
+     tuple(_parse_template(obj) for obj in template["objectives"]))
+    for template in QUEST_TEMPLATES
+]
+
 
 def generate_name(race: str, gender: str = "male") -> str:
     """Generate a random name for a race and gender."""
-    race_lower = race.lower()
+    return _pick_name(race, gender, random)
 
-    # Default to human names for unknown races
+
+def generate_names(race: str, n: int, female_share: float = 0.5) -> List[str]:
+    """Generate n random names for a race, e.g. for a tavern full of patrons.
+
+    female_share is the expected fraction of female first names.
+    """
+    race_lower = race.lower()
     if race_lower not in FIRST_NAMES:
         race_lower = "human"
 
-    first_names = FIRST_NAMES[race_lower].get(gender, FIRST_NAMES[race_lower]["male"])
+    genders = random.choices(_GENDERS, (1 - female_share, female_share), k=n)
+    firsts = [random.choice(_FIRST_NAMES_FLAT[(race_lower, gender)]) for gender in genders]
+    lasts = random.choices(LAST_NAMES.get(race_lower, LAST_NAMES["human"]), k=n)
+
+    return [f"{first} {last}" for first, last in zip(firsts, lasts)]
+
+
+def _pick_name(race: str, gender: str, rng) -> str:
+    """Draw a first and last name for a race and gender from rng."""
+    race_lower = race.lower()
+    first_names = _FIRST_NAMES_FLAT.get((race_lower, gender))
+
+    if first_names is None:
+        # Default to human names for unknown races, male names for unknown genders
+        if race_lower not in FIRST_NAMES:
+            race_lower = "human"
+        first_names = _FIRST_NAMES_FLAT.get((race_lower, gender), _FIRST_NAMES_FLAT[(race_lower, "male")])
+
     last_names = LAST_NAMES.get(race_lower, LAST_NAMES["human"])
 
-    return f"{random.choice(first_names)} {random.choice(last_names)}"
+    return f"{rng.choice(first_names)} {rng.choice(last_names)}"
 
 
 def generate_npc(
@@ -309,11 +414,11 @@ def generate_npc(
     """Generate a random NPC."""
     # Random race if not specified
     if not race:
-        race = random.choice(["human", "human", "human", "elf", "dwarf", "halfling"])
+        race = random.choices(_NPC_RACES, cum_weights=_NPC_RACE_CUM_WEIGHTS)[0]
 
     # Generate name if not specified
     if not name:
-        gender = random.choice(["male", "female"])
+        gender = random.choice(_GENDERS)
         name = generate_name(race, gender)
 
     # Get template
@@ -322,25 +427,75 @@ def generate_npc(
     # Generate description
     description = random.choice(template.get("descriptions", ["A nondescript individual."]))
 
-    # Create NPC
+    traits = _pick_traits(template.get("traits", ()), random)
+
+    return _make_npc(role, race, name, attitude, description, traits, random)
+
+
+def generate_npcs(
+    role: NPCRole,
+    n: int,
+    attitude: NPCAttitude = NPCAttitude.INDIFFERENT,
+    rng: Optional[random.Random] = None
+) -> List[NPC]:
+    """Generate several random NPCs of one role, e.g. to populate a town.
+
+    Races, genders and descriptions are drawn for the whole batch at once.
+    Pass rng to draw from a dedicated random.Random instead of the module.
+    """
+    rng = rng or random
+    template = NPC_TEMPLATES.get(role, NPC_TEMPLATES[NPCRole.QUEST_GIVER])
+    descriptions = template.get("descriptions", ["A nondescript individual."])
+    role_traits = template.get("traits", ())
+
+    races = rng.choices(_NPC_RACES, cum_weights=_NPC_RACE_CUM_WEIGHTS, k=n)
+    genders = rng.choices(_GENDERS, k=n)
+    picked = rng.choices(descriptions, k=n)
+
+    return [
+        _make_npc(role, race, _pick_name(race, gender, rng), attitude, description,
+                  _pick_traits(role_traits, rng), rng)
+        for race, gender, description in zip(races, genders, picked)
+    ]
+
+
+def _pick_traits(traits, rng) -> List[str]:
+    """Pick two different traits, or all of them if there are fewer."""
+    n = len(traits)
+    if n < 2:
+        return list(traits)
+    i = rng.randrange(n)
+    j = rng.randrange(n - 1)
+    if j >= i:
+        j += 1
+    return [traits[i], traits[j]]
+
+
+def _make_npc(
+    role: NPCRole,
+    race: str,
+    name: str,
+    attitude: NPCAttitude,
+    description: str,
+    traits: List[str],
+    rng
+) -> NPC:
+    """Assemble an NPC from already-drawn details."""
     npc = NPC(
-        id=str(uuid.uuid4()),
+        id=_new_id(),
         name=name,
         role=role,
         race=race.capitalize(),
         description=description,
         attitude=attitude,
-        traits=random.sample(template.get("traits", []), min(2, len(template.get("traits", [])))),
+        traits=traits,
     )
 
     # Add role-specific features
     if role == NPCRole.MERCHANT:
-        npc.gold = random.randint(50, 200)
+        npc.gold = rng.randint(50, 200)
         npc.inventory = ["potion_of_healing", "torch", "rope", "rations"]
 
-    # Add basic dialogue
-    _add_basic_dialogue(npc)
-
     return npc
 
 
@@ -349,33 +504,22 @@ def generate_quest_giver(quest_type: Optional[str] = None) -> Tuple[NPC, Quest]:
     npc = generate_npc(NPCRole.QUEST_GIVER)
 
     # Select quest template
-    template = random.choice(QUEST_TEMPLATES)
+    template, name, description, objectives = random.choice(_PARSED_QUEST_TEMPLATES)
 
-    # Fill in template variables
-    locations = ["old mine", "abandoned tower", "dark cave", "ruined temple"]
-    enemies = ["goblins", "bandits", "undead", "orcs"]
-    items = ["ancient artifact", "stolen heirloom", "sacred relic", "merchant's goods"]
-    people = ["a merchant", "a noble's child", "a priest", "a scholar"]
+    # Fill in template variables, drawing each once so the name,
+    # description and objectives agree
+    ctx = {
+        "location": random.choice(_QUEST_LOCATIONS),
+        "enemies": random.choice(_QUEST_ENEMIES),
+        "item": random.choice(_QUEST_ITEMS),
+        "person": random.choice(_QUEST_PEOPLE),
+    }
 
     quest = Quest(
-        id=str(uuid.uuid4()),
-        name=template["name"].format(
-            location=random.choice(locations),
-            item=random.choice(items),
-            person=random.choice(people),
-        ),
-        description=template["description"].format(
-            location=random.choice(locations),
-            enemies=random.choice(enemies),
-            item=random.choice(items),
-            person=random.choice(people),
-        ),
-        objectives=[obj.format(
-            location=random.choice(locations),
-            enemies=random.choice(enemies),
-            item=random.choice(items),
-            person=random.choice(people),
-        ) for obj in template["objectives"]],
+        id=_new_id(),
+        name=_fill(name, ctx),
+        description=_fill(description, ctx),
+        objectives=[_fill(obj, ctx) for obj in objectives],
         reward_xp=template["reward_xp"],
         reward_gold=template["reward_gold"],
     )
@@ -401,29 +545,57 @@ def generate_quest_giver(quest_type: Optional[str] = None) -> Tuple[NPC, Quest]:
         ]
     )
 
-    npc.dialogue_tree["accept"] = DialogueLine(
-        text="Thank you! Please hurry!",
-    )
-
-    npc.dialogue_tree["decline"] = DialogueLine(
-        text="I understand. Perhaps another time.",
-    )
+    npc.dialogue_tree["accept"] = _STATIC_DIALOGUE_LINES["accept"]
+    npc.dialogue_tree["decline"] = _STATIC_DIALOGUE_LINES["decline"]
 
     return npc, quest
 
 
-def _add_basic_dialogue(npc: NPC) -> None:
-    """Add basic dialogue options to an NPC."""
-    npc.dialogue_tree["start"] = DialogueLine(
-        text=npc.get_greeting(),
+# Dialogue lines that are the same for every NPC. These are shared between
+# dialogue trees, so treat them as read-only: replace a line in an NPC's
+# dialogue_tree rather than editing it in place.
+_STATIC_DIALOGUE_LINES: Dict[str, DialogueLine] = {
+    "location": DialogueLine(
+        text="This is a place of adventure and danger. Watch your step.",
         responses=[
-            DialogueResponse("Who are you?", next_dialogue="introduction"),
-            DialogueResponse("What is this place?", next_dialogue="location"),
-            DialogueResponse("Farewell.", next_dialogue="goodbye"),
+            DialogueResponse("Any advice?", next_dialogue="advice"),
+            DialogueResponse("Thanks.", next_dialogue="start"),
         ]
-    )
+    ),
+    "advice": DialogueLine(
+        text="Keep your weapons ready and don't trust everyone you meet.",
+    ),
+    "goodbye": DialogueLine(
+        text="Safe travels.",
+    ),
+    "shop": DialogueLine(
+        text="Take a look at what I have. Fair prices, I assure you.",
+    ),
+    "accept": DialogueLine(
+        text="Thank you! Please hurry!",
+    ),
+    "decline": DialogueLine(
+        text="I understand. Perhaps another time.",
+    ),
+}
+
+
+def _build_start(npc: NPC) -> DialogueLine:
+    """Build an NPC's opening line from its current greeting."""
+    responses = [
+        DialogueResponse("Who are you?", next_dialogue="introduction"),
+        DialogueResponse("What is this place?", next_dialogue="location"),
+        DialogueResponse("Farewell.", next_dialogue="goodbye"),
+    ]
+    if npc.role == NPCRole.MERCHANT:
+        responses.insert(0, DialogueResponse("Show me your wares.", next_dialogue="shop", effect="open_shop"))
 
-    npc.dialogue_tree["introduction"] = DialogueLine(
+    return DialogueLine(text=npc.get_greeting(), responses=responses)
+
+
+def _build_introduction(npc: NPC) -> DialogueLine:
+    """Build the line where an NPC introduces itself."""
+    return DialogueLine(
         text=f"I am {npc.name}, a {npc.role.value.lower()} here.",
         responses=[
             DialogueResponse("Tell me more.", next_dialogue="more_info"),
@@ -431,29 +603,28 @@ def _add_basic_dialogue(npc: NPC) -> None:
         ]
     )
 
-    npc.dialogue_tree["location"] = DialogueLine(
-        text="This is a place of adventure and danger. Watch your step.",
-        responses=[
-            DialogueResponse("Any advice?", next_dialogue="advice"),
-            DialogueResponse("Thanks.", next_dialogue="start"),
-        ]
-    )
-
-    npc.dialogue_tree["advice"] = DialogueLine(
-        text="Keep your weapons ready and don't trust everyone you meet.",
-    )
 
-    npc.dialogue_tree["more_info"] = DialogueLine(
-        text=npc.description,
-    )
+def _build_more_info(npc: NPC) -> DialogueLine:
+    """Build the line where an NPC describes itself."""
+    return DialogueLine(text=npc.description)
 
-    npc.dialogue_tree["goodbye"] = DialogueLine(
-        text="Safe travels.",
-    )
 
+def _build_shop(npc: NPC) -> Optional[DialogueLine]:
+    """Return the shop line, which only merchants have."""
     if npc.role == NPCRole.MERCHANT:
-        npc.dialogue_tree["start"].responses.insert(0, DialogueResponse("Show me your wares.", next_dialogue="shop", effect="open_shop"))
-
-        npc.dialogue_tree["shop"] = DialogueLine(
-            text="Take a look at what I have. Fair prices, I assure you.",
-        )
+        return _STATIC_DIALOGUE_LINES["shop"]
+    return None
+
+
+# Builders for the basic dialogue every NPC has. NPC.get_dialogue calls
+# these the first time a line is asked for, so NPCs the player never
+# talks to never build a dialogue tree.
+_DIALOGUE_BUILDERS: Dict[str, Callable[[NPC], Optional[DialogueLine]]] = {
+    "start": _build_start,
+    "introduction": _build_introduction,
+    "location": lambda npc: _STATIC_DIALOGUE_LINES["location"],
+    "advice": lambda npc: _STATIC_DIALOGUE_LINES["advice"],
+    "more_info": _build_more_info,
+    "goodbye": lambda npc: _STATIC_DIALOGUE_LINES["goodbye"],
+    "shop": _build_shop,
+}
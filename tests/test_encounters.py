@@ -0,0 +1,32 @@
+"""Tests for encounter XP bookkeeping."""
+
+from gamer.world.encounters import Encounter, get_cr_xp, get_encounter_multiplier
+from gamer.world.monsters import get_monster
+
+
+def test_constructor_monsters_count_towards_xp():
+    goblin = get_monster("Goblin")
+    encounter = Encounter(monsters=[goblin.copy(), goblin.copy()])
+    encounter.add_monster(goblin.copy())
+
+    assert encounter.total_xp == 3 * get_cr_xp(goblin.cr)
+    assert encounter.adjusted_xp == int(encounter.total_xp * get_encounter_multiplier(3))
+
+
+def test_add_monster_after_direct_list_change():
+    goblin = get_monster("Goblin")
+    encounter = Encounter(monsters=[goblin.copy(), goblin.copy()])
+    encounter.monsters.pop()
+    encounter.add_monster(goblin.copy())
+
+    assert encounter.total_xp == 2 * get_cr_xp(goblin.cr)
+
+
+def test_add_monster_after_replacing_a_monster():
+    goblin = get_monster("Goblin")
+    ogre = get_monster("Ogre")
+    encounter = Encounter(monsters=[goblin.copy()])
+    encounter.monsters[0] = ogre
+    encounter.add_monster(goblin.copy())
+
+    assert encounter.total_xp == get_cr_xp(ogre.cr) + get_cr_xp(goblin.cr)
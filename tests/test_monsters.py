@@ -0,0 +1,26 @@
+"""Tests for copying and saving monsters."""
+
+import copy
+import pickle
+from dataclasses import asdict
+
+from gamer.world.monsters import MONSTERS, get_monster
+
+
+def test_spawned_monster_deepcopy_and_pickle_round_trip():
+    monster = get_monster("Goblin")
+    monster.take_damage(3)
+
+    for clone in (copy.deepcopy(monster), pickle.loads(pickle.dumps(monster))):
+        assert asdict(clone) == asdict(monster)
+        assert clone.skills == monster.skills
+        assert clone.current_hp == monster.current_hp
+
+
+def test_changing_clone_skills_leaves_template_alone():
+    clone = get_monster("Goblin")
+    stealth = clone.skills["stealth"]
+    clone.skills["stealth"] = 99
+
+    assert MONSTERS["goblin"].skills["stealth"] == stealth
+    assert get_monster("Goblin").skills["stealth"] == stealth